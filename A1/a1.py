@@ -29,6 +29,7 @@ from support import (
 # -----------------------------------------------------------------------------
 
 CMD_STR = HELP_COMMAND + QUIT_COMMAND + HINT_COMMAND
+NUMBER_VALUES = {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5}
 
 
 # Write your classes and functions here
@@ -55,19 +56,66 @@ def generate_initial_board(board_size: int) -> list[list[str]]:
     return board
 
 
+def render_row(board: list[list[str]], row: int) -> str:
+    """
+    Formats a single row of the given game board state
+
+    Parameters:
+        board (list[list[str]]): Board state.
+        row (int): Row of board state to format. Precondition: row is a
+                    valid index.
+
+    Returns:
+        (str): The row as displayed by display_board, without a newline.
+    """
+    guess = " ".join(board[row][:NUM_NUMBERS])
+    feedback = " ".join(board[row][NUM_NUMBERS:])
+    return f"{row + 1:2} {guess}{BOARD_HALVES_SEP}{feedback}"
+
+
+def render_board(board: list[list[str]]) -> str:
+    """
+    Formats the given game board state as a single frame of text
+
+    Parameters:
+        board (list[list[str]]): Board state. Precondition: each row of board
+        will have 2*NUM_NUMBERS elements, and len(board) < 100.
+
+    Returns:
+        (str): Every row followed by the footer, without a final newline.
+    """
+    lines = [render_row(board, row) for row in range(len(board))]
+    lines.append(" ".join(BOARD_FOOTER))
+    return "\n".join(lines)
+
+
+def render_key(key: list[str], used_hints: int) -> str:
+    """
+    Formats the key that has been revealed to the user through hints
+
+    Parameters:
+        key (list[str]): The secret key
+        used_hints (int): The number of hints the user has received so far.
+                            Precondition: used_hints >= 0
+
+    Returns:
+        (str): The key line as displayed by display_key, without a newline.
+    """
+    hidden_key = [HIDDEN_NUMBER] * len(key)
+    slots = key[:used_hints] + hidden_key[used_hints:]
+    return f"Key: {'  '.join(slots)}"
+
+
 def display_board(board: list[list[str]]) -> None:
     """
-    Displays the given game board state to the user in a pleasant format
+    Displays the given game board state to the user in a pleasant format,
+    written out as one frame
 
     Parameters:
         board (list[list[str]]): Board state to display. Precondition: each row
         of board will have 2*NUM_NUMBERS elements, and len(board) < 100.
     """
-    for i, row in enumerate(board, 1):
-        guess = " ".join(row[:NUM_NUMBERS])
-        feedback = " ".join(row[NUM_NUMBERS:])
-        print(f"{i:2} {guess}{BOARD_HALVES_SEP}{feedback}")
-    print(*BOARD_FOOTER)
+    print(render_board(board) + "\n", end="")
 
 
 def display_key(key: list[str], used_hints: int) -> None:
@@ -79,9 +127,36 @@ def display_key(key: list[str], used_hints: int) -> None:
         used_hints (int): The number of hints the user has received so far.
                             Precondition: used_hints >= 0
     """
-    hidden_key = [HIDDEN_NUMBER] * len(key)
-    slots = key[:used_hints] + hidden_key[used_hints:]
-    print(f"Key: {'  '.join(slots)}")
+    print(render_key(key, used_hints))
+
+
+def parse_command(command: str) -> tuple[int, ...] | str:
+    """
+    Parses a mastermind command in a single pass over its parts.
+
+    Parameters:
+        command (str): Command to parse
+
+    Returns:
+        tuple[int, ...] | str: The guessed numbers, or the lowercase special
+                               command (h, q or t).
+
+    Raises:
+        ValueError: With the message to show the user if the command is
+                    invalid.
+    """
+    if command in CMD_STR:
+        return command.lower()
+
+    parts = command.split(",")
+    if len(parts) != NUM_NUMBERS:
+        raise ValueError(INVALID_FORMAT_MESSAGE)
+
+    guess = tuple(NUMBER_VALUES.get(part, 0) for part in parts)
+    if 0 in guess:
+        raise ValueError(INVALID_NUMBER_MESSAGE)
+
+    return guess
 
 
 def check_input(command: str) -> bool:
@@ -95,23 +170,30 @@ def check_input(command: str) -> bool:
     Returns:
         bool: Whether the given command is valid or not.
     """
-    cmd = command.lower()
-    if cmd in CMD_STR:
-        return True
-
-    parts = command.split(",")
-    if len(parts) != NUM_NUMBERS:
-        print(INVALID_FORMAT_MESSAGE)
-        return False
-
-    valid = {"1", "2", "3", "4", "5"}
-    if not all(part in valid for part in parts):
-        print(INVALID_NUMBER_MESSAGE)
+    try:
+        parse_command(command)
+    except ValueError as err:
+        print(err)
         return False
 
     return True
 
 
+def read_command() -> tuple[int, ...] | str:
+    """
+    Repeatedly prompts the user until they enter a valid command.
+
+    Returns:
+    (tuple[int, ...] | str): The guessed numbers, or the lowercase special
+                             command entered.
+    """
+    while True:
+        try:
+            return parse_command(input())
+        except ValueError as err:
+            print(err)
+
+
 def get_command() -> str:
     """
     Repeatedly prompts the user until they enter a valid command,
@@ -166,8 +248,8 @@ def place_feedback(
         row (int): Row of board state to insert feedback. Precondition: row is
                     a valid index.
     """
-    for i in range(5):
-        board[row][5 + i] = feedback[i]
+    for i in range(NUM_NUMBERS):
+        board[row][NUM_NUMBERS + i] = feedback[i]
 
 
 def provide_feedback(key: list[str], guess: str) -> list[str]:
@@ -214,30 +296,92 @@ def provide_feedback(key: list[str], guess: str) -> list[str]:
     return feedback
 
 
+def place_guess_numbers(
+    board: list[list[str]], guess: tuple[int, ...], row: int
+) -> None:
+    """
+    Places guessed numbers onto the guess half of the given board state
+
+    Parameters:
+        board (list[list[str]]): Board state.
+        guess (tuple[int, ...]): Guessed numbers, as from parse_command.
+        row (int): Row of board state to insert guess. Precondition: row is a
+                    valid index.
+    """
+    board[row][:NUM_NUMBERS] = [f"[{number}]" for number in guess]
+
+
+def score_guess(key: tuple[int, ...], guess: tuple[int, ...]) -> list[str]:
+    """
+    Provide feedback on a parsed guess by counting numbers, giving the same
+    feedback as provide_feedback.
+
+    Parameters:
+        key (tuple[int, ...]): The numbers of the secret key.
+        guess (tuple[int, ...]): Guessed numbers, as from parse_command.
+
+    Returns:
+        list[str]: Feedback on guess, in the format of provide_feedback.
+    """
+    blacks = 0
+    unmatched_key: dict[int, int] = {}
+    unmatched_guess = []
+    for key_number, guess_number in zip(key, guess):
+        if key_number == guess_number:
+            blacks += 1
+        else:
+            unmatched_key[key_number] = unmatched_key.get(key_number, 0) + 1
+            unmatched_guess.append(guess_number)
+
+    whites = 0
+    for number in unmatched_guess:
+        if unmatched_key.get(number):
+            unmatched_key[number] -= 1
+            whites += 1
+
+    empty = NUM_NUMBERS - blacks - whites
+    return [BLACK] * blacks + [WHITE] * whites + [EMPTY_FEEDBACK] * empty
+
+
 MAX_ROWS = 10
 MAX_HINTS = 3
 MIN_GUESSES_FOR_HINT = 3
 WIN_FEEDBACK = [BLACK] * NUM_NUMBERS
 
+RENDER_FULL = "full"  # reprint the key and whole board after every guess
+RENDER_INCREMENTAL = "incremental"  # only print the row that changed
+
 
-def play_game() -> None:
+def play_game(render_mode: str = RENDER_FULL) -> None:
     """
     Plays a single game of Mastermind from start to finish.
+
+    Every frame (key, board and prompt) is built as one string and written
+    with a single print.
+
+    Parameters:
+        render_mode (str): RENDER_FULL to redisplay the key and board after
+                           each guess, or RENDER_INCREMENTAL to only display
+                           the newly filled row.
     """
     board = generate_initial_board(MAX_ROWS)
     secret_key = generate_key()
+    key_numbers = tuple(int(slot[1:-1]) for slot in secret_key)
     used_hints = 0
     guesses_made = 0
     row = 0
     feedback = []
 
-    print("Welcome to Mastermind!")
-    display_key(secret_key, used_hints)
-    display_board(board)
-    print(ENTER_COMMAND_MESSAGE, end="")
+    frame = [
+        "Welcome to Mastermind!",
+        render_key(secret_key, used_hints),
+        render_board(board),
+        ENTER_COMMAND_MESSAGE,
+    ]
+    print("\n".join(frame), end="")
 
     while row < MAX_ROWS:
-        cmd = get_command()
+        cmd = read_command()
 
         # quit
         if cmd in QUIT_COMMAND:
@@ -245,40 +389,44 @@ def play_game() -> None:
 
         # help
         if cmd in HELP_COMMAND:
-            print(HELP_MESSAGE)
-            print(ENTER_COMMAND_MESSAGE, end="")
+            print(f"{HELP_MESSAGE}\n{ENTER_COMMAND_MESSAGE}", end="")
             continue
 
         # hint
         if cmd in HINT_COMMAND:
             if used_hints >= MAX_HINTS:
-                print(HINT_MESSAGE)
+                message = HINT_MESSAGE
             elif guesses_made < MIN_GUESSES_FOR_HINT:
-                print(HINT_EARLY_MESSAGE)
+                message = HINT_EARLY_MESSAGE
             else:
                 used_hints += 1
-                display_key(secret_key, used_hints)
+                message = render_key(secret_key, used_hints)
 
-            print(ENTER_COMMAND_MESSAGE, end="")
+            print(f"{message}\n{ENTER_COMMAND_MESSAGE}", end="")
             continue
 
         # valid guess
-        place_guess(board, cmd, row)
-        feedback = provide_feedback(secret_key, cmd)
+        place_guess_numbers(board, cmd, row)
+        feedback = score_guess(key_numbers, cmd)
         place_feedback(board, feedback, row)
         guesses_made += 1
 
         if feedback == WIN_FEEDBACK:
             break
 
+        if render_mode == RENDER_INCREMENTAL:
+            frame = [render_row(board, row), ENTER_COMMAND_MESSAGE]
+        else:
+            frame = [
+                render_key(secret_key, used_hints),
+                render_board(board),
+                ENTER_COMMAND_MESSAGE,
+            ]
+        print("\n".join(frame), end="")
         row += 1
-        display_key(secret_key, used_hints)
-        display_board(board)
-        print(ENTER_COMMAND_MESSAGE, end="")
 
-    print()
-    display_key(secret_key, used_hints)
-    display_board(board)
+    frame = ["", render_key(secret_key, used_hints), render_board(board)]
+    print("\n".join(frame))
 
     if feedback == WIN_FEEDBACK:
         print(WIN_MESSAGE)
@@ -288,12 +436,18 @@ def play_game() -> None:
     print(f"The secret key was: {' '.join(secret_key)}")
 
 
-def main() -> None:
+def main(render_mode: str = RENDER_FULL) -> None:
     """
     The main function (You should write a better docstring!)
+
+    Parameters:
+        render_mode (str): How each game redisplays the board, as in
+                           play_game. Running a1.py always uses RENDER_FULL,
+                           since this module cannot import a command line
+                           parser; call main(RENDER_INCREMENTAL) instead.
     """
     while True:
-        play_game()
+        play_game(render_mode)
         retry: str = input(RETRY_MESSAGE).strip().lower()
         if retry.lower() != "y":
             break
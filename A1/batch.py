@@ -0,0 +1,243 @@
+"""
+Non-interactive batch mode for playing many scripted games.
+
+Reads a stream of games from stdin (or a file) and plays each one under the
+rules of `a1.play_game`, without prompts or rendering, writing one compact
+result record per game. The stream is either text, one game per line:
+
+    <key> <command> <command> ...
+
+where the key is written like a guess (e.g. "1,2,3,4,5") and the commands
+are exactly what a player would type, except that commands are separated
+by whitespace and so cannot contain any (a guess typed with a trailing
+space cannot be replayed as written), or a binary game log in the format
+written by `replay.py --write-log`. Blank lines and lines starting with "#"
+are skipped.
+
+Each result is "<outcome> <guesses> <hints> <invalid commands>" (e.g.
+"W 4 1 0"), or the same four values as bytes with --binary-output.
+
+Usage:
+    python3 batch.py < games.txt > results.txt
+    python3 batch.py games.mmlog --binary-output > results.bin
+"""
+import argparse
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator
+
+from a1 import parse_command
+from engine import MastermindGame
+from replay import (
+    GUESS,
+    HELP,
+    HINT_EARLY,
+    HINT_GIVEN,
+    HINT_USED_UP,
+    INVALID_FORMAT,
+    INVALID_NUMBER,
+    LOG_MAGIC,
+    QUIT,
+    UNKNOWN_KEY,
+    iter_log,
+)
+from scoring import CODE_SPACE, encode_digits
+from support import INVALID_NUMBER_MESSAGE
+
+# Outcomes of a game
+WON = 0
+LOST = 1
+ABANDONED = 2  # quit, or the commands ran out before the game ended
+BAD_KEY = 3  # the key was missing or invalid, so nothing was played
+OUTCOME_NAMES = "WLAE"
+
+RESULT = struct.Struct("<BBBB")  # outcome, guesses, hints, invalid commands
+HINT_KINDS = (HINT_GIVEN, HINT_EARLY, HINT_USED_UP)
+
+Command = tuple[int, int]  # kind of command, guess code
+Result = tuple[int, int, int, int]
+
+
+def _parse_text_command(command: str) -> Command:
+    """
+    Classifies a command as typed by the player.
+    """
+    try:
+        parsed = parse_command(command)
+    except ValueError as err:
+        if str(err) == INVALID_NUMBER_MESSAGE:
+            return INVALID_NUMBER, 0
+        return INVALID_FORMAT, 0
+    if isinstance(parsed, tuple):
+        return GUESS, encode_digits(parsed)
+    if parsed == "q":
+        return QUIT, 0
+    if parsed == "t":
+        return HINT_GIVEN, 0
+    return HELP, 0
+
+
+def read_text_games(lines: Iterable[bytes]) -> Iterator[tuple[int, list]]:
+    """
+    Reads games written one per line. A line that is not valid UTF-8 is
+    still read, and its undecodable parts make the key or command invalid.
+
+    Parameters:
+        lines (Iterable[bytes]): The lines of the stream.
+
+    Returns:
+        (Iterator[tuple[int, list[Command]]]): The key code (UNKNOWN_KEY if
+            it is invalid) and commands of each game.
+    """
+    for line in lines:
+        # Undecodable bytes become U+FFFD, which no key or command accepts
+        parts = line.decode(errors="replace").split()
+        if not parts or parts[0].startswith("#"):
+            continue
+        kind, key_code = _parse_text_command(parts[0])
+        if kind != GUESS:
+            key_code = UNKNOWN_KEY
+        yield key_code, [_parse_text_command(part) for part in parts[1:]]
+
+
+def read_log_games(stream: BinaryIO) -> Iterator[tuple[int, list]]:
+    """
+    Reads games from a binary game log, one game at a time.
+
+    A key code outside the code space makes the key invalid (UNKNOWN_KEY),
+    and a guess with a code outside it counts as an invalid command, so a
+    corrupt game is reported rather than stopping the batch. If the log
+    ends part way through a game, that game is read as an invalid key with
+    no commands and reading stops.
+
+    Parameters:
+        stream (BinaryIO): The log, positioned after its header.
+
+    Returns:
+        (Iterator[tuple[int, list[Command]]]): The key code and commands of
+            each game.
+    """
+    games = iter_log(stream)
+    while True:
+        try:
+            key_code, steps = next(games)
+        except StopIteration:
+            return
+        except ValueError:
+            yield UNKNOWN_KEY, []
+            return
+        if key_code >= CODE_SPACE:
+            key_code = UNKNOWN_KEY
+        commands = []
+        for kind, guess_code, _, _ in steps:
+            if kind == GUESS and guess_code >= CODE_SPACE:
+                commands.append((INVALID_FORMAT, 0))
+            else:
+                commands.append((kind, guess_code))
+        yield key_code, commands
+
+
+def read_games(stream: BinaryIO) -> Iterator[tuple[int, list]]:
+    """
+    Reads games from a text or binary stream, detected from its first bytes.
+    """
+    if stream.peek(len(LOG_MAGIC)).startswith(LOG_MAGIC):
+        stream.read(len(LOG_MAGIC))
+        return read_log_games(stream)
+    return read_text_games(stream)
+
+
+def play_commands(key_code: int, commands: list[Command]) -> Result:
+    """
+    Plays one game, following `a1.play_game`: invalid commands and help are
+    ignored, hints are only given once allowed, and commands after the game
+    ends are ignored.
+
+    Parameters:
+        key_code (int): The integer code of the secret key.
+        commands (list[Command]): The commands entered, in order.
+
+    Returns:
+        (Result): The outcome, guesses made, hints given and number of
+                  invalid commands.
+    """
+    if key_code == UNKNOWN_KEY:
+        return BAD_KEY, 0, 0, 0
+    game = MastermindGame(key_code)
+    invalid = 0
+    quit_game = False
+    for kind, guess_code in commands:
+        if kind == GUESS:
+            game.step(guess_code)
+        elif kind in HINT_KINDS:
+            game.hint()
+        elif kind == QUIT:
+            quit_game = True
+        elif kind != HELP:
+            invalid += 1
+        if quit_game or game.is_over():
+            break
+
+    if game.is_won():
+        outcome = WON
+    elif game.is_over():
+        outcome = LOST
+    else:
+        outcome = ABANDONED
+    return outcome, game.get_num_guesses(), game.get_used_hints(), invalid
+
+
+def format_result(result: Result) -> str:
+    """
+    Returns a result as a line of text, e.g. "W 4 1 0".
+    """
+    outcome, guesses, hints, invalid = result
+    return f"{OUTCOME_NAMES[outcome]} {guesses} {hints} {invalid}\n"
+
+
+def run_batch(source: BinaryIO, out: BinaryIO, binary: bool = False) -> int:
+    """
+    Plays every game in source and writes a result record for each to out.
+
+    Parameters:
+        source (BinaryIO): A text or binary stream of games.
+        out (BinaryIO): Where to write results.
+        binary (bool): Whether to write RESULT records instead of text.
+
+    Returns:
+        (int): The number of games played.
+    """
+    games = 0
+    for key_code, commands in read_games(source):
+        result = play_commands(key_code, commands)
+        if binary:
+            # Invalid commands are capped to fit in a byte
+            out.write(RESULT.pack(*result[:3], min(result[3], 0xFF)))
+        else:
+            out.write(format_result(result).encode())
+        games += 1
+    return games
+
+
+def main() -> None:
+    """
+    Plays a batch of games from a file or stdin.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "path", nargs="?", help="games to play (default stdin)"
+    )
+    parser.add_argument("--binary-output", action="store_true")
+    args = parser.parse_args()
+
+    out = sys.stdout.buffer
+    if args.path is None:
+        run_batch(sys.stdin.buffer, out, args.binary_output)
+    else:
+        with open(args.path, "rb") as source:
+            run_batch(source, out, args.binary_output)
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Benchmarks of the hot functions in `a1` and of full headless games.
+
+Each benchmark runs a fixed, seeded batch of operations, discarding their
+results. Its speed is the best of several timed measurements, each running
+the batch enough times to take at least MIN_TIME seconds, in operations per
+second. Its memory is the peak traced by `tracemalloc` while running the
+batch once, which is the most any one operation holds at a time plus the
+batch's own overhead. Everything runs offline with the standard library.
+
+Rates depend on the machine, so no baseline is shipped. Once a baseline has
+been saved locally with --save, results are compared with it and any
+benchmark that is slower, or peaks higher, than the baseline by more than
+the tolerance is flagged. Without one, results are only printed.
+
+Usage:
+    python3 bench.py [--baseline bench_baseline.json] [--tolerance 0.25]
+    python3 bench.py --save
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tracemalloc
+from random import Random
+from timeit import Timer
+
+from a1 import (
+    MAX_ROWS,
+    check_input,
+    display_board,
+    generate_initial_board,
+    get_command,
+    parse_command,
+    place_feedback,
+    place_guess,
+    provide_feedback,
+    render_board,
+)
+from engine import MastermindGame
+from scoring import CODE_SPACE, decode_code
+from simulate import play
+from solver import EXPECTED_SIZE, Solver
+from support import MAX_NUMBER, NUM_NUMBERS
+
+SEED = 7030
+BATCH_SIZE = 2000
+REPEATS = 5
+MIN_TIME = 0.2  # seconds per timed measurement
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "bench_baseline.json"
+)
+DEFAULT_TOLERANCE = 0.25
+
+
+def _random_codes(rng: Random, count: int) -> list[int]:
+    return [rng.randrange(CODE_SPACE) for _ in range(count)]
+
+
+def _key(code: int) -> list[str]:
+    """
+    Returns a code in the format of `generate_key` (e.g. ["[1]", ...]).
+    """
+    return [f"[{number}]" for number in decode_code(code)]
+
+
+def _guess(code: int) -> str:
+    """
+    Returns a code in the format of `get_command` (e.g. "[1],[2],...").
+    """
+    return ",".join(_key(code))
+
+
+def _commands(rng: Random, count: int) -> list[str]:
+    """
+    Returns a mix of valid guesses, special commands and invalid input.
+    """
+    commands = []
+    for _ in range(count):
+        digits = [str(rng.randint(1, MAX_NUMBER)) for _ in range(NUM_NUMBERS)]
+        kind = rng.randrange(10)
+        if kind == 0:
+            commands.append(rng.choice(["h", "H", "q", "hint"]))
+        elif kind == 1:
+            commands.append(",".join(digits[:-1]))
+        elif kind == 2:
+            digits[rng.randrange(NUM_NUMBERS)] = "9"
+            commands.append(",".join(digits))
+        else:
+            commands.append(",".join(digits))
+    return commands
+
+
+def _bench_provide_feedback(rng: Random):
+    pairs = [
+        (_key(key), _guess(guess))
+        for key, guess in zip(
+            _random_codes(rng, BATCH_SIZE), _random_codes(rng, BATCH_SIZE)
+        )
+    ]
+
+    def run() -> None:
+        for key, guess in pairs:
+            provide_feedback(key, guess)
+
+    return run, len(pairs)
+
+
+def _bench_check_input(rng: Random):
+    commands = _commands(rng, BATCH_SIZE)
+
+    def run() -> None:
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            for command in commands:
+                check_input(command)
+
+    return run, len(commands)
+
+
+def _bench_parse_command(rng: Random):
+    commands = _commands(rng, BATCH_SIZE)
+
+    def run() -> None:
+        for command in commands:
+            try:
+                parse_command(command)
+            except ValueError:
+                pass
+
+    return run, len(commands)
+
+
+def _bench_get_command(rng: Random):
+    # Each get_command call reads lines until the first valid command
+    commands = _commands(rng, BATCH_SIZE)
+    text = "\n".join(commands) + "\n"
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        valid = sum(map(check_input, commands))
+
+    def run() -> None:
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            stdin = sys.stdin
+            sys.stdin = io.StringIO(text)
+            try:
+                for _ in range(valid):
+                    get_command()
+            finally:
+                sys.stdin = stdin
+
+    return run, valid
+
+
+def _bench_place_guess(rng: Random):
+    board = generate_initial_board(MAX_ROWS)
+    guesses = [_guess(code) for code in _random_codes(rng, BATCH_SIZE)]
+
+    def run() -> None:
+        for i, guess in enumerate(guesses):
+            place_guess(board, guess, i % MAX_ROWS)
+
+    return run, len(guesses)
+
+
+def _bench_place_feedback(rng: Random):
+    board = generate_initial_board(MAX_ROWS)
+    feedback = [
+        provide_feedback(_key(key), _guess(guess))
+        for key, guess in zip(
+            _random_codes(rng, BATCH_SIZE), _random_codes(rng, BATCH_SIZE)
+        )
+    ]
+
+    def run() -> None:
+        for i, row_feedback in enumerate(feedback):
+            place_feedback(board, row_feedback, i % MAX_ROWS)
+
+    return run, len(feedback)
+
+
+def _full_board(rng: Random) -> list[list[str]]:
+    board = generate_initial_board(MAX_ROWS)
+    key = _key(rng.randrange(CODE_SPACE))
+    for row in range(MAX_ROWS):
+        guess = _guess(rng.randrange(CODE_SPACE))
+        place_guess(board, guess, row)
+        place_feedback(board, provide_feedback(key, guess), row)
+    return board
+
+
+def _bench_render_board(rng: Random):
+    boards = [_full_board(rng) for _ in range(BATCH_SIZE // 10)]
+
+    def run() -> None:
+        for board in boards:
+            render_board(board)
+
+    return run, len(boards)
+
+
+def _bench_display_board(rng: Random):
+    boards = [_full_board(rng) for _ in range(BATCH_SIZE // 10)]
+
+    def run() -> None:
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            for board in boards:
+                display_board(board)
+
+    return run, len(boards)
+
+
+def _bench_headless_game(rng: Random):
+    keys = _random_codes(rng, BATCH_SIZE // 10)
+    solver = Solver(EXPECTED_SIZE, candidates_only=True)
+    for key_code in keys:
+        play(MastermindGame(key_code), solver)  # warm the solver's cache
+
+    def run() -> None:
+        for key_code in keys:
+            play(MastermindGame(key_code), solver)
+
+    return run, len(keys)
+
+
+# name -> builds (a batch to run, operations per batch) from a generator
+BENCHMARKS = {
+    "provide_feedback": _bench_provide_feedback,
+    "check_input": _bench_check_input,
+    "parse_command": _bench_parse_command,
+    "get_command": _bench_get_command,
+    "place_guess": _bench_place_guess,
+    "place_feedback": _bench_place_feedback,
+    "render_board": _bench_render_board,
+    "display_board": _bench_display_board,
+    "headless_game": _bench_headless_game,
+}
+
+
+def run_benchmark(name: str, repeats: int = REPEATS) -> dict[str, float]:
+    """
+    Runs one benchmark.
+
+    Parameters:
+        name (str): A key of BENCHMARKS.
+        repeats (int): The number of timed measurements.
+
+    Returns:
+        (dict[str, float]): "ops_per_sec", the best speed of the timed
+                            measurements, and "peak_bytes", the peak memory
+                            allocated while running the batch once.
+    """
+    batch, ops = BENCHMARKS[name](Random(f"{SEED}:{name}"))
+    batch()  # warm up caches before timing
+    timer = Timer(batch)
+    number = 1
+    while timer.timeit(number) < MIN_TIME:
+        number *= 2
+    best = min(timer.repeat(repeat=repeats, number=number)) / number
+
+    tracemalloc.start()
+    batch()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ops_per_sec": ops / best, "peak_bytes": peak}
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """
+    Returns a message for each benchmark that regressed against the baseline.
+
+    Parameters:
+        results (dict[str, dict[str, float]]): Results of run_benchmark.
+        baseline (dict[str, dict[str, float]]): Stored results to compare to.
+        tolerance (float): The fraction by which a benchmark may be slower, or
+                           peak higher, before it is flagged.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+            regressions.append(f"{name}: {change:.1%} ops/sec")
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + tolerance):
+            change = result["peak_bytes"] / base["peak_bytes"] - 1
+            regressions.append(f"{name}: +{change:.1%} peak bytes")
+    return regressions
+
+
+def main() -> None:
+    """
+    Runs the benchmarks and flags regressions against the local baseline,
+    if one has been saved.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("names", nargs="*", help="benchmarks to run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument(
+        "--save", action="store_true", help="store results as the baseline"
+    )
+    args = parser.parse_args()
+    unknown = set(args.names).difference(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    results = {}
+    print(f"{'benchmark':<18}{'ops/sec':>12}{'baseline':>12}{'peak B':>10}")
+    for name in args.names or BENCHMARKS:
+        results[name] = result = run_benchmark(name, args.repeats)
+        base = baseline.get(name, {}).get("ops_per_sec")
+        base_text = f"{base:>12.0f}" if base else f"{'-':>12}"
+        print(
+            f"{name:<18}{result['ops_per_sec']:>12.0f}{base_text}"
+            f"{result['peak_bytes']:>10.0f}"
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+        return
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --save to record one")
+        return
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
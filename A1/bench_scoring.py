@@ -0,0 +1,70 @@
+"""
+Benchmark of scoring cost as the code space grows.
+
+Times the counting scorer in `config` for variants from the standard 5x5 game
+up to 8 slots of 10 numbers (a code space of 10^8), alongside the reference
+`provide_feedback` and the lookup table in `scoring` for the standard game.
+
+Usage:
+    python3 bench_scoring.py [--pairs 20000]
+"""
+import argparse
+from random import Random
+from timeit import timeit
+
+from a1 import provide_feedback
+from config import GameConfig
+from scoring import DEFAULT_TABLE, encode_digits
+
+VARIANTS = [(5, 5), (5, 8), (6, 8), (8, 8), (8, 10)]
+SEED = 7030
+
+
+def _per_call(func, pairs: list) -> float:
+    """
+    Returns the mean time in nanoseconds of func over every pair.
+    """
+    seconds = timeit(lambda: [func(a, b) for a, b in pairs], number=1)
+    return seconds / len(pairs) * 1e9
+
+
+def main() -> None:
+    """
+    Prints the scoring cost of each variant.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--pairs", type=int, default=20000)
+    args = parser.parse_args()
+    rng = Random(SEED)
+
+    print(f"{'scorer':<24}{'code space':>14}{'ns/score':>12}")
+    for num_numbers, max_number in VARIANTS:
+        config = GameConfig(num_numbers, max_number)
+        pairs = [
+            (config.random_key(rng), config.random_key(rng))
+            for _ in range(args.pairs)
+        ]
+        name = f"counting {num_numbers}x{max_number}"
+        ns = _per_call(config.score, pairs)
+        print(f"{name:<24}{config.get_code_space():>14}{ns:>12.0f}")
+
+        if (num_numbers, max_number) == VARIANTS[0]:
+            strings = [
+                (
+                    [f"[{n}]" for n in key],
+                    ",".join(f"[{n}]" for n in guess),
+                )
+                for key, guess in pairs
+            ]
+            ns = _per_call(provide_feedback, strings)
+            space = config.get_code_space()
+            print(f"{'provide_feedback 5x5':<24}{space:>14}{ns:>12.0f}")
+
+            codes = [(encode_digits(a), encode_digits(b)) for a, b in pairs]
+            DEFAULT_TABLE.fill()
+            ns = _per_call(DEFAULT_TABLE.score, codes)
+            print(f"{'table 5x5':<24}{space:>14}{ns:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
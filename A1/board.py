@@ -0,0 +1,135 @@
+"""
+Compact Mastermind board for headless games.
+
+Each row is NUM_NUMBERS guessed numbers (0 for an empty slot) followed by the
+black and white counts of its feedback, all stored in one flat byte array.
+The string board used by `a1.display_board` is only built when rendering.
+"""
+from array import array
+
+from a1 import display_board, render_board
+from scoring import (
+    CODE_DIGITS,
+    FEEDBACK_BASE,
+    encode_digits,
+    feedback_to_list,
+)
+from support import EMPTY_FEEDBACK, EMPTY_GUESS, NUM_NUMBERS
+
+ROW_WIDTH = NUM_NUMBERS + 2
+BLACK_SLOT = NUM_NUMBERS
+WHITE_SLOT = NUM_NUMBERS + 1
+
+
+class CompactBoard:
+    """
+    A Mastermind board stored as a flat array of small integers.
+    """
+
+    __slots__ = ("_cells", "_num_rows")
+
+    def __init__(self, num_rows: int) -> None:
+        """
+        Parameters:
+            num_rows (int): The number of rows on the board.
+                            Precondition: num_rows > 0
+        """
+        self._num_rows = num_rows
+        self._cells = array("B", bytes(num_rows * ROW_WIDTH))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._num_rows})"
+
+    def get_num_rows(self) -> int:
+        """
+        Returns the number of rows on the board.
+        """
+        return self._num_rows
+
+    def is_row_empty(self, row: int) -> bool:
+        """
+        Returns whether no guess has been placed in the given row.
+        """
+        return self._cells[row * ROW_WIDTH] == 0
+
+    def place_guess(self, row: int, guess_code: int) -> None:
+        """
+        Places a guess into the guess half of a row.
+
+        Parameters:
+            row (int): Row to place the guess in.
+            guess_code (int): The integer code of the guess.
+        """
+        start = row * ROW_WIDTH
+        end = start + NUM_NUMBERS
+        self._cells[start:end] = array("B", CODE_DIGITS[guess_code])
+
+    def place_score(self, row: int, score: int) -> None:
+        """
+        Places feedback into the feedback half of a row.
+
+        Parameters:
+            row (int): Row to place the feedback in.
+            score (int): The packed feedback score.
+        """
+        black, white = divmod(score, FEEDBACK_BASE)
+        start = row * ROW_WIDTH
+        self._cells[start + BLACK_SLOT] = black
+        self._cells[start + WHITE_SLOT] = white
+
+    def get_guess(self, row: int) -> int | None:
+        """
+        Returns the integer code guessed in a row, or None if it is empty.
+        """
+        if self.is_row_empty(row):
+            return None
+        start = row * ROW_WIDTH
+        end = start + NUM_NUMBERS
+        return encode_digits(self._cells[start:end])
+
+    def get_score(self, row: int) -> int | None:
+        """
+        Returns the packed feedback score of a row, or None if it is empty.
+        """
+        if self.is_row_empty(row):
+            return None
+        start = row * ROW_WIDTH
+        black = self._cells[start + BLACK_SLOT]
+        return black * FEEDBACK_BASE + self._cells[start + WHITE_SLOT]
+
+    def to_rows(self) -> list[list[str]]:
+        """
+        Builds the board in the format of `a1.generate_initial_board`.
+
+        Returns:
+            (list[list[str]]): Each row's bracketed guess numbers followed by
+                               its feedback, or empty slots.
+        """
+        rows = []
+        for row in range(self._num_rows):
+            if self.is_row_empty(row):
+                rows.append(
+                    [EMPTY_GUESS] * NUM_NUMBERS
+                    + [EMPTY_FEEDBACK] * NUM_NUMBERS
+                )
+                continue
+            start = row * ROW_WIDTH
+            end = start + NUM_NUMBERS
+            guess = self._cells[start:end]
+            rows.append(
+                [f"[{number}]" for number in guess]
+                + feedback_to_list(self.get_score(row))
+            )
+        return rows
+
+    def render(self) -> str:
+        """
+        Returns the board as a single frame of text, as `a1.render_board`.
+        """
+        return render_board(self.to_rows())
+
+    def display(self) -> None:
+        """
+        Displays the board in the same format as `a1.display_board`.
+        """
+        display_board(self.to_rows())
@@ -0,0 +1,178 @@
+"""
+Game configuration for Mastermind variants.
+
+The standard game is NUM_NUMBERS slots of numbers 1..MAX_NUMBER, but a
+GameConfig can describe larger variants (e.g. 8 slots of 10 numbers), and
+parse, generate and score keys and guesses for them. Scoring here counts
+numbers rather than searching the key, so it costs
+O(num_numbers + max_number) regardless of how large the code space grows;
+the lookup tables in `scoring` are only practical for the standard game.
+
+Only this module and `bench_scoring.py` handle other sizes: `a1.play_game`,
+`engine.MastermindGame`, `solver.Solver` and `keygen.KeyStream` all play
+the standard game.
+"""
+from operator import eq
+from random import Random
+
+from a1 import MAX_ROWS
+from support import MAX_NUMBER, NUM_NUMBERS
+
+
+class GameConfig:
+    """
+    The size of a Mastermind variant: how many slots a key has, how many
+    numbers each slot can take, and how many guesses are allowed.
+    """
+
+    def __init__(
+        self,
+        num_numbers: int = NUM_NUMBERS,
+        max_number: int = MAX_NUMBER,
+        max_rows: int = MAX_ROWS,
+    ) -> None:
+        """
+        Parameters:
+            num_numbers (int): The number of slots in a key. Must be > 0.
+            max_number (int): Slots take numbers 1..max_number. Must be > 0.
+            max_rows (int): The number of guesses allowed. Must be > 0.
+        """
+        if num_numbers <= 0:
+            raise ValueError("A key must have at least one slot")
+        if max_number <= 0:
+            raise ValueError("Slots must allow at least one number")
+        if max_rows <= 0:
+            raise ValueError("A game must allow at least one guess")
+        self._num_numbers = num_numbers
+        self._max_number = max_number
+        self._max_rows = max_rows
+        self._valid = frozenset(str(n) for n in range(1, max_number + 1))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._num_numbers}, "
+            f"{self._max_number}, {self._max_rows})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, GameConfig) and self._sizes() == other._sizes()
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._sizes())
+
+    def _sizes(self) -> tuple[int, int, int]:
+        return self._num_numbers, self._max_number, self._max_rows
+
+    def get_num_numbers(self) -> int:
+        """
+        Returns the number of slots in a key.
+        """
+        return self._num_numbers
+
+    def get_max_number(self) -> int:
+        """
+        Returns the largest number a slot can take.
+        """
+        return self._max_number
+
+    def get_max_rows(self) -> int:
+        """
+        Returns the number of guesses allowed.
+        """
+        return self._max_rows
+
+    def get_code_space(self) -> int:
+        """
+        Returns the number of distinct keys.
+        """
+        return self._max_number**self._num_numbers
+
+    def get_feedback_base(self) -> int:
+        """
+        Returns the multiplier of the black count in a packed score.
+        """
+        return self._num_numbers + 1
+
+    def get_win_score(self) -> int:
+        """
+        Returns the packed score of a guess that matches the key.
+        """
+        return self._num_numbers * self.get_feedback_base()
+
+    def encode(self, digits: tuple[int, ...]) -> int:
+        """
+        Encodes the numbers in each slot as an integer code.
+        """
+        code = 0
+        for digit in digits:
+            code = code * self._max_number + digit - 1
+        return code
+
+    def decode(self, code: int) -> tuple[int, ...]:
+        """
+        Decodes an integer code into the numbers in each slot.
+        """
+        digits = [0] * self._num_numbers
+        for i in range(self._num_numbers - 1, -1, -1):
+            code, digit = divmod(code, self._max_number)
+            digits[i] = digit + 1
+        return tuple(digits)
+
+    def random_key(self, rng: Random) -> tuple[int, ...]:
+        """
+        Draws a key the same way as `generate_key`, from the given generator.
+        """
+        return tuple(
+            rng.choices(range(1, self._max_number + 1), k=self._num_numbers)
+        )
+
+    def parse_guess(self, command: str) -> tuple[int, ...] | None:
+        """
+        Parses a comma separated guess such as "1,2,3,4,5".
+
+        Parameters:
+            command (str): The text entered by the user.
+
+        Returns:
+            (tuple[int, ...] | None): The guessed numbers, or None if the
+                                      command is not a valid guess.
+        """
+        parts = command.split(",")
+        if len(parts) != self._num_numbers:
+            return None
+        if not self._valid.issuperset(parts):
+            return None
+        return tuple(map(int, parts))
+
+    def score(self, key: tuple[int, ...], guess: tuple[int, ...]) -> int:
+        """
+        Scores a guess against a key by counting numbers.
+
+        Parameters:
+            key (tuple[int, ...]): The numbers in each slot of the key.
+            guess (tuple[int, ...]): The numbers in each slot of the guess.
+
+        Returns:
+            (int): The packed feedback score, black * feedback base + white.
+        """
+        black = sum(map(eq, key, guess))
+        key_counts = [0] * (self._max_number + 1)
+        for digit in key:
+            key_counts[digit] += 1
+        total = 0
+        for digit in guess:
+            if key_counts[digit]:
+                key_counts[digit] -= 1
+                total += 1
+        return black * self._num_numbers + total
+
+    def score_codes(self, key_code: int, guess_code: int) -> int:
+        """
+        Scores a guess against a key, both given as integer codes.
+        """
+        return self.score(self.decode(key_code), self.decode(guess_code))
+
+
+DEFAULT_CONFIG = GameConfig()
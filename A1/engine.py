@@ -0,0 +1,152 @@
+"""
+Headless Mastermind engine.
+
+Plays the same rules as `a1.play_game` (rows, hints and winning feedback)
+without any input or output, with keys and guesses as integer codes from
+`scoring` and the board held as a `CompactBoard`.
+"""
+from a1 import MAX_HINTS, MAX_ROWS, MIN_GUESSES_FOR_HINT
+from board import CompactBoard
+from scoring import (
+    CODE_SPACE,
+    DEFAULT_TABLE,
+    WIN_SCORE,
+    FeedbackTable,
+    decode_code,
+)
+
+
+class GameOverError(Exception):
+    """
+    Raised when a guess is made after the game has finished.
+    """
+
+    pass
+
+
+class MastermindGame:
+    """
+    The state of a single game of Mastermind, advanced one guess at a time.
+    """
+
+    def __init__(
+        self,
+        key_code: int,
+        max_rows: int = MAX_ROWS,
+        table: FeedbackTable = DEFAULT_TABLE,
+    ) -> None:
+        """
+        Parameters:
+            key_code (int): The integer code of the secret key.
+            max_rows (int): The number of guesses allowed.
+            table (FeedbackTable): The table to score with.
+        """
+        if not 0 <= key_code < CODE_SPACE:
+            raise ValueError(f"Invalid key code: {key_code}")
+        self._key_code = key_code
+        self._table = table
+        self._max_rows = max_rows
+        self._board = CompactBoard(max_rows)
+        self._num_guesses = 0
+        self._won = False
+        self._used_hints = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._key_code})"
+
+    def get_key(self) -> int:
+        """
+        Returns the integer code of the secret key.
+        """
+        return self._key_code
+
+    def get_board(self) -> CompactBoard:
+        """
+        Returns the board holding every guess and its feedback.
+        """
+        return self._board
+
+    def get_num_guesses(self) -> int:
+        """
+        Returns the number of guesses made so far.
+        """
+        return self._num_guesses
+
+    def get_guesses(self) -> list[int]:
+        """
+        Returns the codes guessed so far.
+        """
+        return [self._board.get_guess(row) for row in range(self._num_guesses)]
+
+    def get_scores(self) -> list[int]:
+        """
+        Returns the packed feedback score of each guess so far.
+        """
+        return [self._board.get_score(row) for row in range(self._num_guesses)]
+
+    def get_used_hints(self) -> int:
+        """
+        Returns the number of hints taken so far.
+        """
+        return self._used_hints
+
+    def is_won(self) -> bool:
+        """
+        Returns whether the last guess was the key.
+        """
+        return self._won
+
+    def is_over(self) -> bool:
+        """
+        Returns whether the game has been won or has run out of rows.
+        """
+        return self._won or self._num_guesses >= self._max_rows
+
+    def step(self, guess_code: int) -> int:
+        """
+        Places a guess in the next row and returns its feedback.
+
+        Parameters:
+            guess_code (int): The integer code of the guess.
+
+        Returns:
+            (int): The packed feedback score for the guess.
+        """
+        if self.is_over():
+            raise GameOverError("The game is already over")
+        # Feedback is symmetric, and the guess's row is far more likely to
+        # be cached already than the key's
+        score = self._table.row(guess_code)[self._key_code]
+        self._board.place_guess(self._num_guesses, guess_code)
+        self._board.place_score(self._num_guesses, score)
+        self._num_guesses += 1
+        self._won = score == WIN_SCORE
+        return score
+
+    def can_hint(self) -> bool:
+        """
+        Returns whether a hint would be given if requested now.
+        """
+        return (
+            self._used_hints < MAX_HINTS
+            and self._num_guesses >= MIN_GUESSES_FOR_HINT
+        )
+
+    def hint(self) -> bool:
+        """
+        Requests a hint, revealing one more slot of the key if allowed.
+
+        Returns:
+            (bool): Whether a hint was given.
+        """
+        if not self.can_hint():
+            return False
+        self._used_hints += 1
+        return True
+
+    def get_revealed(self) -> tuple[int, ...]:
+        """
+        Returns the numbers of the key revealed by hints so far.
+        """
+        used_hints = self._used_hints
+        return decode_code(self._key_code)[:used_hints]
@@ -0,0 +1,195 @@
+"""
+Hint timing analysis.
+
+A hint policy says after how many guesses each hint is taken, e.g. (3, 3, 3)
+takes every hint as soon as it is allowed and () never takes one. Each
+policy is evaluated against every possible key at once by walking the
+solver's decision tree: the keys reaching a position are split by the
+feedback row of the guess made there (or by the numbers a hint reveals),
+so each position is scored once for all the keys that reach it rather than
+replaying 3125 games. Policies are evaluated across a process pool.
+
+Usage:
+    python3 hints.py [--strategy expected] [--processes N] [--top 10]
+"""
+import argparse
+from array import array
+from itertools import combinations_with_replacement
+from multiprocessing import Pool
+from operator import itemgetter
+
+from a1 import MAX_HINTS, MAX_ROWS, MIN_GUESSES_FOR_HINT
+from scoring import WIN_SCORE
+from solver import ALL_CODES, EXPECTED_SIZE, STRATEGIES, Solver
+from support import MAX_NUMBER, NUM_NUMBERS
+
+History = tuple[tuple[int, int], ...]
+
+
+def hint_policies() -> list[tuple[int, ...]]:
+    """
+    Returns every hint policy: each way of taking up to MAX_HINTS hints
+    after MIN_GUESSES_FOR_HINT..MAX_ROWS - 1 guesses.
+    """
+    policies: list[tuple[int, ...]] = []
+    turns = range(MIN_GUESSES_FOR_HINT, MAX_ROWS)
+    for count in range(MAX_HINTS + 1):
+        policies += combinations_with_replacement(turns, count)
+    return policies
+
+
+def _walk(
+    solver: Solver,
+    keys: array,
+    history: History,
+    guesses: int,
+    hints: int,
+    policy: tuple[int, ...],
+) -> tuple[int, int]:
+    """
+    Plays every key in keys from the position reached by history.
+
+    Parameters:
+        solver (Solver): The solver choosing guesses.
+        keys (array): The keys consistent with history, ascending.
+        history (History): Guesses and hints so far, as `Solver.get_history`.
+        guesses (int): Guesses made so far.
+        hints (int): Hints taken so far.
+        policy (tuple[int, ...]): The hint policy being played.
+
+    Returns:
+        (tuple[int, int]): The number of keys won, and the total guesses taken
+                           to win them.
+    """
+    groups: dict[int, array] = {}
+    if hints < len(policy) and guesses >= policy[hints]:
+        # Take a hint: split the keys by the numbers it would reveal
+        span = MAX_NUMBER ** (NUM_NUMBERS - hints - 1)
+        for code in keys:
+            groups.setdefault(code // span, array("H")).append(code)
+        wins = total = 0
+        for prefix_code, group in groups.items():
+            entry = (-(hints + 1), prefix_code)
+            won, taken = _walk(
+                solver, group, history + (entry,), guesses, hints + 1, policy
+            )
+            wins += won
+            total += taken
+        return wins, total
+
+    if guesses >= MAX_ROWS:
+        return 0, 0
+
+    guess = solver.decide(history, keys)
+    row = solver.get_table().row(guess)
+    scores = (row[keys[0]],) if len(keys) == 1 else itemgetter(*keys)(row)
+    for code, score in zip(keys, scores):
+        groups.setdefault(score, array("H")).append(code)
+
+    wins = total = 0
+    for score, group in groups.items():
+        if score == WIN_SCORE:
+            wins += len(group)
+            total += len(group) * (guesses + 1)
+            continue
+        won, taken = _walk(
+            solver,
+            group,
+            history + ((guess, score),),
+            guesses + 1,
+            hints,
+            policy,
+        )
+        wins += won
+        total += taken
+    return wins, total
+
+
+def evaluate_policy(
+    policy: tuple[int, ...], solver: Solver
+) -> tuple[int, int]:
+    """
+    Evaluates a hint policy against every possible key.
+
+    Parameters:
+        policy (tuple[int, ...]): After how many guesses each hint is taken.
+        solver (Solver): The solver choosing guesses.
+
+    Returns:
+        (tuple[int, int]): The number of keys won, and the total guesses taken
+                           to win them.
+    """
+    policy = tuple(sorted(max(turn, MIN_GUESSES_FOR_HINT) for turn in policy))
+    return _walk(solver, ALL_CODES, (), 0, 0, policy[:MAX_HINTS])
+
+
+# Per-process solver, so decisions stay cached across policies
+_worker_solver: Solver | None = None
+
+
+def _init_worker(strategy: str) -> None:
+    global _worker_solver
+    _worker_solver = Solver(strategy, candidates_only=True)
+
+
+def _evaluate(policy: tuple[int, ...]) -> tuple[tuple[int, ...], int, int]:
+    assert _worker_solver is not None
+    return (policy, *evaluate_policy(policy, _worker_solver))
+
+
+def analyse(
+    strategy: str = EXPECTED_SIZE,
+    policies: list[tuple[int, ...]] | None = None,
+    processes: int | None = None,
+) -> list[tuple[tuple[int, ...], int, int]]:
+    """
+    Evaluates hint policies across a process pool.
+
+    Parameters:
+        strategy (str): The solver strategy, one of `solver.STRATEGIES`.
+        policies (list[tuple[int, ...]] | None): The policies to evaluate.
+            Defaults to every policy from hint_policies.
+        processes (int | None): Worker processes. Defaults to the CPU count.
+                                1 evaluates everything in this process.
+
+    Returns:
+        (list[tuple[tuple[int, ...], int, int]]): (policy, keys won, total
+            guesses to win them) for each policy, best first: most keys won,
+            then fewest guesses.
+    """
+    if policies is None:
+        policies = hint_policies()
+    if processes == 1:
+        _init_worker(strategy)
+        results = [_evaluate(policy) for policy in policies]
+    else:
+        with Pool(processes, _init_worker, (strategy,)) as pool:
+            results = pool.map(_evaluate, policies)
+    return sorted(results, key=lambda result: (-result[1], result[2]))
+
+
+def main() -> None:
+    """
+    Prints the best hint policies and the result of never taking a hint.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--strategy", choices=STRATEGIES, default=EXPECTED_SIZE
+    )
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = analyse(args.strategy, processes=args.processes)
+    print(f"{'hints after guesses':<24}{'won':>6}{'mean guesses':>14}")
+    shown = results[: args.top]
+    if not any(not policy for policy, _, _ in shown):
+        shown += [result for result in results if not result[0]]
+    for policy, wins, total in shown:
+        name = ", ".join(map(str, policy)) or "never"
+        mean = total / wins if wins else 0.0
+        print(f"{name:<24}{wins:>6}{mean:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
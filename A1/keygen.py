@@ -0,0 +1,92 @@
+"""
+Reproducible secret key streams.
+
+`generate_key` draws from the global `random` state, seeded once on import,
+so parallel workers cannot reproduce each other's keys. A KeyStream has its
+own generator seeded from (seed, stream id); streams with different ids are
+independent, so each worker or chunk of games can take its own stream and
+the keys it draws do not depend on how work is scheduled.
+"""
+from array import array
+from math import floor
+from random import Random
+
+from config import DEFAULT_CONFIG, GameConfig
+
+# Array typecodes by the largest code space they can hold
+CODE_TYPECODES = [(1 << 16, "H"), (1 << 32, "I"), (1 << 64, "Q")]
+# Beyond this, scaling random() no longer reaches every code
+FLOAT_EXACT_LIMIT = 1 << 53
+
+
+class KeyStream:
+    """
+    An independent, seedable stream of secret keys.
+    """
+
+    def __init__(
+        self, seed: int, stream: int = 0, config: GameConfig = DEFAULT_CONFIG
+    ) -> None:
+        """
+        Parameters:
+            seed (int): The seed shared by all streams of a run.
+            stream (int): This stream's id within the run.
+            config (GameConfig): The size of the keys to draw.
+        """
+        self._seed = seed
+        self._stream = stream
+        self._config = config
+        # String seeds are hashed with SHA-512, so nearby (seed, stream)
+        # pairs give unrelated generator states.
+        self._rng = Random(f"{seed}:{stream}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._seed}, {self._stream})"
+
+    def next_digits(self) -> tuple[int, ...]:
+        """
+        Draws a key's numbers the same way as `generate_key`.
+        """
+        return self._config.random_key(self._rng)
+
+    def next_key(self) -> list[str]:
+        """
+        Draws a key in the format of `generate_key` (e.g. ["[1]", ...]).
+        """
+        return [f"[{number}]" for number in self.next_digits()]
+
+    def next_code(self) -> int:
+        """
+        Draws a key as an integer code.
+        """
+        return self._config.encode(self.next_digits())
+
+    def codes(self, count: int) -> array:
+        """
+        Draws many keys as a packed array of integer codes.
+
+        Each code takes a single draw from the generator, so the codes are
+        uniformly distributed like those from next_code, but are not the
+        same sequence.
+
+        Parameters:
+            count (int): The number of keys to draw.
+
+        Returns:
+            (array): The codes, in the smallest unsigned integer array
+                     that holds every code.
+        """
+        code_space = self._config.get_code_space()
+        fits = [limit >= code_space for limit, _ in CODE_TYPECODES]
+        if not any(fits):
+            raise ValueError("Codes are too large to pack into an array")
+        typecode = CODE_TYPECODES[fits.index(True)][1]
+        if code_space > FLOAT_EXACT_LIMIT:
+            randrange = self._rng.randrange
+            return array(
+                typecode, [randrange(code_space) for _ in range(count)]
+            )
+        random = self._rng.random
+        return array(
+            typecode, [floor(random() * code_space) for _ in range(count)]
+        )
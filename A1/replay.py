@@ -0,0 +1,484 @@
+"""
+Replays recorded Mastermind games through the game logic in `a1`.
+
+A recording is either a raw gameplay transcript (like those in `gameplay/`)
+or a compact binary log of the same games. Each command is run through
+`check_input` and each guess through `parse_command` and `score_guess`, as
+`play_game` scores it, without `input()`, and every response is checked
+against the one recorded and against `provide_feedback`. A directory of
+recordings can be replayed across a process pool.
+
+Usage:
+    python3 replay.py gameplay/ [--processes N]
+    python3 replay.py gameplay/losses.txt --write-log losses.mmlog
+"""
+import argparse
+import contextlib
+import io
+import os
+import re
+import struct
+from multiprocessing import Pool
+from typing import BinaryIO, Iterator
+
+from a1 import (
+    MAX_HINTS,
+    MIN_GUESSES_FOR_HINT,
+    check_input,
+    parse_command,
+    provide_feedback,
+    score_guess,
+)
+from scoring import (
+    decode_code,
+    encode_digits,
+    encode_key,
+    feedback_to_list,
+    pack_feedback,
+    WIN_SCORE,
+)
+from support import (
+    BLACK,
+    ENTER_COMMAND_MESSAGE,
+    HELP_COMMAND,
+    HINT_COMMAND,
+    HINT_EARLY_MESSAGE,
+    HINT_MESSAGE,
+    INVALID_FORMAT_MESSAGE,
+    INVALID_NUMBER_MESSAGE,
+    QUIT_COMMAND,
+    RETRY_MESSAGE,
+    WHITE,
+)
+
+# Kinds of response a command can get
+GUESS = 0
+HELP = 1
+QUIT = 2
+HINT_GIVEN = 3
+HINT_EARLY = 4
+HINT_USED_UP = 5
+INVALID_FORMAT = 6
+INVALID_NUMBER = 7
+KIND_NAMES = [
+    "guess",
+    "help",
+    "quit",
+    "hint",
+    "early hint",
+    "no hints left",
+    "invalid format",
+    "invalid number",
+]
+INVALID_KINDS = (INVALID_FORMAT, INVALID_NUMBER)
+
+TRANSCRIPT_EXTENSION = ".txt"
+LOG_EXTENSION = ".mmlog"
+LOG_MAGIC = b"MMLG\x02"
+LOG_GAME = struct.Struct("<HH")  # key code, number of steps
+UNKNOWN_KEY = 0xFFFF
+# Kind, guess code (or for invalid commands, the length of the command's
+# UTF-8 text, which follows the step), feedback score
+LOG_STEP = struct.Struct("<BHB")
+MAX_COMMAND_BYTES = 0xFFFF  # longer invalid commands are cut short
+
+LogStep = tuple[int, int, int, bytes]  # kind, guess code, score, command
+
+WELCOME_LINE = "Welcome to Mastermind!"
+KEY_LINE = "key was: "
+HELP_LINE = "Valid commands:"
+BOARD_ROW = re.compile(r"^\s*(\d+) (.*) \|\| \|\| (.*)$")
+RETRY_PROMPT = RETRY_MESSAGE.strip()
+
+Step = tuple[str, int, int]  # command, response kind, feedback score
+
+
+class GameRecord:
+    """
+    A recorded game: the secret key and each command with its response.
+    """
+
+    def __init__(self, key: list[str] | None, steps: list[Step]) -> None:
+        """
+        Parameters:
+            key (list[str] | None): The secret key, as from `generate_key`,
+                or None if the recording does not reveal it.
+            steps (list[Step]): (command, kind, score) for each command.
+                The score is only meaningful for guesses.
+        """
+        self._key = key
+        self._steps = steps
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._key}, {self._steps})"
+
+    def get_key(self) -> list[str] | None:
+        """
+        Returns the secret key, or None if it is not known.
+        """
+        return self._key
+
+    def get_steps(self) -> list[Step]:
+        """
+        Returns each recorded command with its response.
+        """
+        return self._steps
+
+
+def _feedback_score(feedback: list[str]) -> int:
+    """
+    Packs the feedback shown on a board row.
+    """
+    return pack_feedback(feedback.count(BLACK), feedback.count(WHITE))
+
+
+def _classify(command: str, response: list[str], row: int) -> Step:
+    """
+    Works out how the game responded to a command from the lines printed
+    after it.
+
+    Parameters:
+        command (str): The command entered.
+        response (list[str]): The lines printed before the next prompt.
+        row (int): The board row a valid guess would be placed in (from 1).
+    """
+    text = "\n".join(response)
+    for message, kind in (
+        (INVALID_FORMAT_MESSAGE, INVALID_FORMAT),
+        (INVALID_NUMBER_MESSAGE, INVALID_NUMBER),
+        (HINT_EARLY_MESSAGE, HINT_EARLY),
+        (HINT_MESSAGE, HINT_USED_UP),
+        (HELP_LINE, HELP),
+    ):
+        if message.strip() in text:
+            return command, kind, 0
+    if command in QUIT_COMMAND:
+        return command, QUIT, 0
+    if command in HINT_COMMAND:
+        return command, HINT_GIVEN, 0
+
+    for line in response:
+        match = BOARD_ROW.match(line)
+        if match and int(match.group(1)) == row:
+            return command, GUESS, _feedback_score(match.group(3).split())
+    raise ValueError(f"No board row {row} shown after guess {command!r}")
+
+
+def _parse_game(lines: list[str]) -> GameRecord:
+    """
+    Parses the lines of one game in a transcript.
+    """
+    key = None
+    commands: list[tuple[str, list[str]]] = []
+    for line in lines:
+        if ENTER_COMMAND_MESSAGE in line:
+            commands.append((line.split(ENTER_COMMAND_MESSAGE, 1)[1], []))
+        elif KEY_LINE in line:
+            key = line.split(KEY_LINE, 1)[1].split()
+        elif commands and RETRY_PROMPT not in line:
+            commands[-1][1].append(line)
+
+    steps: list[Step] = []
+    guesses = 0
+    for command, response in commands:
+        steps.append(_classify(command, response, guesses + 1))
+        guesses += steps[-1][1] == GUESS
+
+    # Older transcripts only show the key when the game is lost
+    if key is None and guesses and steps[-1][1:] == (GUESS, WIN_SCORE):
+        key = [f"[{number}]" for number in steps[-1][0].split(",")]
+    return GameRecord(key, steps)
+
+
+def parse_transcript(text: str) -> list[GameRecord]:
+    """
+    Parses a gameplay transcript into the games it contains.
+
+    Parameters:
+        text (str): The transcript, i.e. everything printed and entered.
+
+    Returns:
+        (list[GameRecord]): The games played, in order.
+    """
+    games = []
+    for game in text.split(WELCOME_LINE)[1:]:
+        games.append(_parse_game(game.split("\n")))
+    return games
+
+
+def _command_text(kind: int, guess_code: int, command: bytes) -> str:
+    """
+    Returns the command of a logged step: the recorded text of an invalid
+    command, or a command that gets the given kind of response.
+    """
+    if kind == GUESS:
+        return ",".join(map(str, decode_code(guess_code)))
+    if kind == HELP:
+        return HELP_COMMAND[0]
+    if kind == QUIT:
+        return QUIT_COMMAND[0]
+    if kind in (HINT_GIVEN, HINT_EARLY, HINT_USED_UP):
+        return HINT_COMMAND[0]
+    return command.decode(errors="replace")
+
+
+def write_log(games: list[GameRecord], file) -> None:
+    """
+    Writes games to a binary log.
+
+    Parameters:
+        games (list[GameRecord]): The games to write.
+        file: A binary file object to write to.
+    """
+    file.write(LOG_MAGIC)
+    for game in games:
+        steps = game.get_steps()
+        key = game.get_key()
+        key_code = UNKNOWN_KEY if key is None else encode_key(key)
+        file.write(LOG_GAME.pack(key_code, len(steps)))
+        for command, kind, score in steps:
+            guess_code = 0
+            raw = b""
+            if kind == GUESS:
+                guess_code = encode_digits(tuple(map(int, command.split(","))))
+            elif kind in INVALID_KINDS:
+                raw = command.encode()[:MAX_COMMAND_BYTES]
+                guess_code = len(raw)
+            file.write(LOG_STEP.pack(kind, guess_code, score) + raw)
+
+
+def iter_log(stream: BinaryIO) -> Iterator[tuple[int, list[LogStep]]]:
+    """
+    Reads the games in a binary log one at a time.
+
+    Parameters:
+        stream (BinaryIO): The log, positioned after LOG_MAGIC.
+
+    Returns:
+        (Iterator[tuple[int, list[LogStep]]]): The key code and steps of each
+            game. The command of a step is empty unless it was invalid.
+
+    Raises:
+        ValueError: If the log ends part way through a game.
+    """
+
+    def read(size: int) -> bytes:
+        data = stream.read(size)
+        if len(data) < size:
+            raise ValueError("Game log ends part way through a game")
+        return data
+
+    while header := stream.read(LOG_GAME.size):
+        if len(header) < LOG_GAME.size:
+            raise ValueError("Game log ends part way through a game")
+        key_code, num_steps = LOG_GAME.unpack(header)
+        steps = []
+        for _ in range(num_steps):
+            kind, guess_code, score = LOG_STEP.unpack(read(LOG_STEP.size))
+            command = b""
+            if kind in INVALID_KINDS:
+                command = read(guess_code)
+            steps.append((kind, guess_code, score, command))
+        yield key_code, steps
+
+
+def read_log(data: bytes) -> list[GameRecord]:
+    """
+    Reads the games in a binary log.
+
+    Parameters:
+        data (bytes): The contents of the log.
+
+    Returns:
+        (list[GameRecord]): The games in the log.
+    """
+    if not data.startswith(LOG_MAGIC):
+        raise ValueError("Not a Mastermind game log")
+    games = []
+    stream = io.BytesIO(data)
+    stream.seek(len(LOG_MAGIC))
+    for key_code, log_steps in iter_log(stream):
+        steps = [
+            (_command_text(kind, guess_code, command), kind, score)
+            for kind, guess_code, score, command in log_steps
+        ]
+        key = None
+        if key_code != UNKNOWN_KEY:
+            key = [f"[{number}]" for number in decode_code(key_code)]
+        games.append(GameRecord(key, steps))
+    return games
+
+
+def replay_game(game: GameRecord) -> list[str]:
+    """
+    Runs a recorded game through `check_input`, and each guess through
+    `parse_command` and `score_guess` as `play_game` does. Feedback is also
+    checked against `provide_feedback`, unless the recording does not
+    reveal the key.
+
+    Parameters:
+        game (GameRecord): The game to replay.
+
+    Returns:
+        (list[str]): A description of each response that differs from the
+                     recording. Empty if the game replayed identically.
+    """
+    mismatches = []
+    key = game.get_key()
+    key_numbers = ()
+    if key is not None:
+        key_numbers = tuple(int(slot[1:-1]) for slot in key)
+    guesses = 0
+    used_hints = 0
+    for i, (command, expected, expected_score) in enumerate(game.get_steps()):
+        messages = io.StringIO()
+        with contextlib.redirect_stdout(messages):
+            valid = check_input(command)
+
+        score = 0
+        if not valid:
+            invalid_number = INVALID_NUMBER_MESSAGE in messages.getvalue()
+            kind = INVALID_NUMBER if invalid_number else INVALID_FORMAT
+        elif command in QUIT_COMMAND:
+            kind = QUIT
+        elif command in HELP_COMMAND:
+            kind = HELP
+        elif command in HINT_COMMAND:
+            if used_hints >= MAX_HINTS:
+                kind = HINT_USED_UP
+            elif guesses < MIN_GUESSES_FOR_HINT:
+                kind = HINT_EARLY
+            else:
+                kind = HINT_GIVEN
+                used_hints += 1
+        else:
+            kind = GUESS
+            guesses += 1
+            if key is not None:
+                parsed = parse_command(command)
+                assert isinstance(parsed, tuple)
+                feedback = score_guess(key_numbers, parsed)
+                score = _feedback_score(feedback)
+                guess = ",".join(f"[{n}]" for n in command.split(","))
+                reference = provide_feedback(key, guess)
+                if feedback != reference:
+                    mismatches.append(
+                        f"step {i + 1} ({command!r}): score_guess gave "
+                        f"{feedback}, provide_feedback gave {reference}"
+                    )
+            else:
+                score = expected_score
+
+        if kind != expected:
+            mismatches.append(
+                f"step {i + 1} ({command!r}): expected "
+                f"{KIND_NAMES[expected]}, got {KIND_NAMES[kind]}"
+            )
+        elif kind == GUESS and score != expected_score:
+            mismatches.append(
+                f"step {i + 1} ({command!r}): expected feedback "
+                f"{feedback_to_list(expected_score)}, "
+                f"got {feedback_to_list(score)}"
+            )
+    return mismatches
+
+
+def load_recording(path: str) -> list[GameRecord]:
+    """
+    Loads the games in a transcript or binary log.
+    """
+    if path.endswith(LOG_EXTENSION):
+        with open(path, "rb") as file:
+            return read_log(file.read())
+    with open(path, "r") as file:
+        return parse_transcript(file.read())
+
+
+def replay_file(path: str) -> tuple[str, int, list[str]]:
+    """
+    Replays every game in a recording.
+
+    Returns:
+        (tuple[str, int, list[str]]): The path, the number of games, and
+                                      every mismatch prefixed by its game.
+    """
+    games = load_recording(path)
+    mismatches = []
+    for number, game in enumerate(games, 1):
+        for mismatch in replay_game(game):
+            mismatches.append(f"game {number}, {mismatch}")
+    return path, len(games), mismatches
+
+
+def expand_paths(paths: list[str]) -> list[str]:
+    """
+    Returns the recording files named by paths, replacing each directory by
+    the transcripts and logs it contains, sorted by name.
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for name in sorted(os.listdir(path)):
+            if name.endswith((TRANSCRIPT_EXTENSION, LOG_EXTENSION)):
+                files.append(os.path.join(path, name))
+    return files
+
+
+def replay_paths(
+    paths: list[str], processes: int | None = None
+) -> list[tuple[str, int, list[str]]]:
+    """
+    Replays recordings, expanding directories into the recordings they
+    contain, across a process pool.
+
+    Parameters:
+        paths (list[str]): Recording files and directories of recordings.
+        processes (int | None): Worker processes. Defaults to the CPU count.
+                                1 replays everything in this process.
+
+    Returns:
+        (list[tuple[str, int, list[str]]]): `replay_file` for each recording,
+                                            sorted by path.
+    """
+    files = expand_paths(paths)
+    if processes == 1:
+        return [replay_file(file) for file in files]
+    with Pool(processes) as pool:
+        return sorted(pool.imap_unordered(replay_file, files, chunksize=16))
+
+
+def main() -> None:
+    """
+    Replays recordings from the command line and reports any mismatches.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--write-log", metavar="FILE")
+    args = parser.parse_args()
+
+    if args.write_log:
+        games = []
+        for path in expand_paths(args.paths):
+            games += load_recording(path)
+        with open(args.write_log, "wb") as file:
+            write_log(games, file)
+        print(f"Wrote {len(games)} games to {args.write_log}")
+        return
+
+    failed = 0
+    for path, num_games, mismatches in replay_paths(
+        args.paths, args.processes
+    ):
+        status = "ok" if not mismatches else f"{len(mismatches)} mismatches"
+        print(f"{path}: {num_games} games, {status}")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        failed += bool(mismatches)
+    print(f"{failed} of the replayed recordings did not match")
+
+
+if __name__ == "__main__":
+    main()
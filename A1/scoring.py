@@ -0,0 +1,328 @@
+"""
+Integer-encoded scoring engine for Mastermind.
+
+Keys and guesses are encoded as integers in the range [0, CODE_SPACE), with
+the first slot as the most significant base-MAX_NUMBER digit, and feedback is
+packed into a single small integer (black * FEEDBACK_BASE + white). Feedback
+for a key is computed once for every possible guess and cached as a row of
+bytes, so scoring a guess is a single table lookup, and scoring many guesses
+against many keys is a gather over those rows.
+
+`a1.provide_feedback` remains the reference implementation; this module is an
+optional engine for bots and simulations that score many guesses.
+"""
+from operator import eq, itemgetter
+
+from support import BLACK, EMPTY_FEEDBACK, MAX_NUMBER, NUM_NUMBERS, WHITE
+
+CODE_SPACE = MAX_NUMBER**NUM_NUMBERS
+FEEDBACK_BASE = NUM_NUMBERS + 1
+WIN_SCORE = NUM_NUMBERS * FEEDBACK_BASE
+
+
+def encode_digits(digits: tuple[int, ...]) -> int:
+    """
+    Encodes a sequence of numbers (each 1..MAX_NUMBER) as an integer code.
+
+    Parameters:
+        digits (tuple[int, ...]): The numbers in each slot of the key.
+
+    Returns:
+        (int): The integer code for the given numbers.
+    """
+    code = 0
+    for digit in digits:
+        code = code * MAX_NUMBER + digit - 1
+    return code
+
+
+def decode_code(code: int) -> tuple[int, ...]:
+    """
+    Decodes an integer code back into the numbers in each slot.
+
+    Parameters:
+        code (int): An integer code. Precondition: 0 <= code < CODE_SPACE
+
+    Returns:
+        (tuple[int, ...]): The numbers (each 1..MAX_NUMBER) in each slot.
+    """
+    digits = [0] * NUM_NUMBERS
+    for i in range(NUM_NUMBERS - 1, -1, -1):
+        code, digit = divmod(code, MAX_NUMBER)
+        digits[i] = digit + 1
+    return tuple(digits)
+
+
+def encode_key(key: list[str]) -> int:
+    """
+    Encodes a key in the format produced by `generate_key` (e.g. ["[1]", ...]).
+
+    Parameters:
+        key (list[str]): The secret key.
+
+    Returns:
+        (int): The integer code for the key.
+    """
+    return encode_digits(tuple(int(slot[1:-1]) for slot in key))
+
+
+def encode_guess(guess: str) -> int:
+    """
+    Encodes a guess in the format produced by `get_command`
+    (e.g. "[1],[2],[3],[4],[5]").
+
+    Parameters:
+        guess (str): The user's guess.
+
+    Returns:
+        (int): The integer code for the guess.
+    """
+    return encode_key(guess.split(","))
+
+
+def pack_feedback(black: int, white: int) -> int:
+    """
+    Packs black and white counts into a single feedback score.
+    """
+    return black * FEEDBACK_BASE + white
+
+
+def unpack_feedback(score: int) -> tuple[int, int]:
+    """
+    Returns the (black, white) counts of a packed feedback score.
+    """
+    return divmod(score, FEEDBACK_BASE)
+
+
+def feedback_to_list(score: int) -> list[str]:
+    """
+    Expands a packed feedback score into the padded list format returned by
+    `provide_feedback`.
+
+    Parameters:
+        score (int): A packed feedback score.
+
+    Returns:
+        (list[str]): Blacks, then whites, padded with EMPTY_FEEDBACK.
+    """
+    black, white = divmod(score, FEEDBACK_BASE)
+    empty = NUM_NUMBERS - black - white
+    return [BLACK] * black + [WHITE] * white + [EMPTY_FEEDBACK] * empty
+
+
+def _count_numbers(digits: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Returns how many times each number 1..MAX_NUMBER appears in digits.
+    """
+    counts = [0] * MAX_NUMBER
+    for digit in digits:
+        counts[digit - 1] += 1
+    return tuple(counts)
+
+
+# Every code decoded once, plus an index of its number counts. Only 126 count
+# signatures exist for 5 slots of 5 numbers, so the total number of matches
+# (black + white) against a key is computed per signature, not per guess.
+CODE_DIGITS = [decode_code(code) for code in range(CODE_SPACE)]
+_SIGNATURES: list[tuple[int, ...]] = []
+_SIGNATURE_IDS: dict[tuple[int, ...], int] = {}
+CODE_SIGNATURES = []
+for _digits in CODE_DIGITS:
+    _counts = _count_numbers(_digits)
+    if _counts not in _SIGNATURE_IDS:
+        _SIGNATURE_IDS[_counts] = len(_SIGNATURES)
+        _SIGNATURES.append(_counts)
+    CODE_SIGNATURES.append(_SIGNATURE_IDS[_counts])
+
+
+def score_codes(key_code: int, guess_code: int) -> int:
+    """
+    Scores a guess against a key without using a table.
+
+    Parameters:
+        key_code (int): The integer code of the secret key.
+        guess_code (int): The integer code of the guess.
+
+    Returns:
+        (int): The packed feedback score.
+    """
+    key = CODE_DIGITS[key_code]
+    guess = CODE_DIGITS[guess_code]
+    black = sum(map(eq, key, guess))
+    key_counts = _SIGNATURES[CODE_SIGNATURES[key_code]]
+    guess_counts = _SIGNATURES[CODE_SIGNATURES[guess_code]]
+    total = sum(map(min, key_counts, guess_counts))
+    return black * FEEDBACK_BASE + total - black
+
+
+def _compute_row(key_code: int) -> bytes:
+    """
+    Scores every possible guess against the given key.
+
+    Parameters:
+        key_code (int): The integer code of the secret key.
+
+    Returns:
+        (bytes): The packed feedback score of each guess, indexed by code.
+    """
+    # Codes are enumerated slot by slot, so the black counts of every code
+    # can be built up one slot at a time rather than compared per code.
+    blacks = [0]
+    for digit in CODE_DIGITS[key_code]:
+        hits = [int(number == digit) for number in range(1, MAX_NUMBER + 1)]
+        blacks = [black + hit for black in blacks for hit in hits]
+
+    key_counts = _SIGNATURES[CODE_SIGNATURES[key_code]]
+    totals = [sum(map(min, key_counts, counts)) for counts in _SIGNATURES]
+    return bytes(
+        [
+            black * (FEEDBACK_BASE - 1) + totals[signature]
+            for black, signature in zip(blacks, CODE_SIGNATURES)
+        ]
+    )
+
+
+class FeedbackTable:
+    """
+    A CODE_SPACE x CODE_SPACE table of packed feedback scores, filled lazily
+    one key (row) at a time.
+
+    Feedback is symmetric, so row(code) also holds the score of the guess
+    `code` against every possible key.
+    """
+
+    def __init__(self) -> None:
+        self._rows: list[bytes | None] = [None] * CODE_SPACE
+
+    def row(self, key_code: int) -> bytes:
+        """
+        Returns the scores of every guess against the given key.
+
+        Parameters:
+            key_code (int): The integer code of the secret key.
+
+        Returns:
+            (bytes): Packed feedback scores indexed by guess code.
+        """
+        row = self._rows[key_code]
+        if row is None:
+            row = self._rows[key_code] = _compute_row(key_code)
+        return row
+
+    def score(self, key_code: int, guess_code: int) -> int:
+        """
+        Returns the packed feedback score of a guess against a key.
+        """
+        return self.row(key_code)[guess_code]
+
+    def fill(self) -> None:
+        """
+        Computes every row of the table up front.
+        """
+        for key_code in range(CODE_SPACE):
+            self.row(key_code)
+
+    def filled_rows(self) -> int:
+        """
+        Returns the number of rows computed so far.
+        """
+        return CODE_SPACE - self._rows.count(None)
+
+
+DEFAULT_TABLE = FeedbackTable()
+
+
+def provide_feedback_fast(
+    key: list[str], guess: str, table: FeedbackTable = DEFAULT_TABLE
+) -> list[str]:
+    """
+    Drop-in replacement for `provide_feedback` served from a FeedbackTable.
+
+    Parameters:
+        key (list[str]): The secret key.
+        guess (str): The user's guess, as returned by `get_command`.
+        table (FeedbackTable): The table to score with.
+
+    Returns:
+        (list[str]): Feedback in the same format as `provide_feedback`.
+    """
+    return feedback_to_list(table.score(encode_key(key), encode_guess(guess)))
+
+
+# Translation tables splitting packed scores into black and white counts.
+_BLACKS = bytes(min(score // FEEDBACK_BASE, 255) for score in range(256))
+_WHITES = bytes(score % FEEDBACK_BASE for score in range(256))
+
+
+def _gather(row: bytes, codes: list[int]) -> bytes:
+    """
+    Returns row[code] for each code, in order.
+    """
+    if len(codes) == 1:
+        return bytes((row[codes[0]],))
+    return bytes(itemgetter(*codes)(row))
+
+
+def batch_scores(
+    key_codes: list[int],
+    guess_codes: list[int],
+    table: FeedbackTable = DEFAULT_TABLE,
+) -> bytearray:
+    """
+    Scores every guess against every key.
+
+    Rows are taken from whichever side has fewer distinct codes, so that as
+    few table rows as possible need computing.
+
+    Parameters:
+        key_codes (list[int]): Integer codes of the keys.
+        guess_codes (list[int]): Integer codes of the guesses.
+        table (FeedbackTable): The table to score with.
+
+    Returns:
+        (bytearray): Packed feedback scores in row-major order, i.e. the score
+                     of guess j against key i is at i * len(guess_codes) + j.
+    """
+    num_guesses = len(guess_codes)
+    scores = bytearray(len(key_codes) * num_guesses)
+    if not scores:
+        return scores
+
+    if len(set(key_codes)) <= len(set(guess_codes)):
+        for i, key_code in enumerate(key_codes):
+            start = i * num_guesses
+            end = start + num_guesses
+            scores[start:end] = _gather(table.row(key_code), guess_codes)
+    else:
+        for j, guess_code in enumerate(guess_codes):
+            scores[j::num_guesses] = _gather(table.row(guess_code), key_codes)
+    return scores
+
+
+def batch_feedback(
+    keys: list[tuple[int, ...]],
+    guesses: list[tuple[int, ...]],
+    table: FeedbackTable = DEFAULT_TABLE,
+) -> tuple[bytes, bytes]:
+    """
+    Batch counterpart to `provide_feedback`: scores every guess against every
+    key, with keys and guesses given as sequences of numbers rather than
+    bracketed strings.
+
+    Parameters:
+        keys (list[tuple[int, ...]]): The keys, e.g. [(1, 2, 3, 4, 5), ...].
+        guesses (list[tuple[int, ...]]): The guesses, in the same format.
+        table (FeedbackTable): The table to score with.
+
+    Returns:
+        (tuple[bytes, bytes]): The black counts and the white counts, each in
+                               row-major (key, guess) order.
+    """
+    scores = bytes(
+        batch_scores(
+            [encode_digits(tuple(key)) for key in keys],
+            [encode_digits(tuple(guess)) for guess in guesses],
+            table,
+        )
+    )
+    return scores.translate(_BLACKS), scores.translate(_WHITES)
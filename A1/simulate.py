@@ -0,0 +1,223 @@
+"""
+Headless Mastermind simulator.
+
+Plays many seeded games with a solver across a process pool and aggregates
+win rate, guesses-to-win and hint usage. Games are played in fixed-size
+chunks, each drawing its keys from its own `keygen` stream, so results do not
+depend on how chunks are split between processes.
+
+Usage:
+    python3 simulate.py --games 1000000 --strategy expected --processes 8
+"""
+import argparse
+from multiprocessing import Pool, cpu_count
+
+from a1 import MAX_HINTS, MAX_ROWS, MIN_GUESSES_FOR_HINT
+from engine import MastermindGame
+from keygen import KeyStream
+from solver import EXPECTED_SIZE, STRATEGIES, Solver
+
+DEFAULT_SEED = 7030
+CHUNK_SIZE = 10000
+EARLIEST_HINTS = (MIN_GUESSES_FOR_HINT,) * MAX_HINTS  # every hint, ASAP
+
+
+class SimulationResult:
+    """
+    Aggregated results of a number of simulated games.
+    """
+
+    def __init__(self) -> None:
+        self._games = 0
+        self._wins = 0
+        self._hints = 0
+        self._guess_counts = [0] * (MAX_ROWS + 1)  # wins by guesses taken
+
+    def __str__(self) -> str:
+        lines = [
+            f"Games: {self._games}",
+            f"Win rate: {self.win_rate():.4%}",
+            f"Mean guesses to win: {self.mean_guesses():.4f}",
+            f"Hints used: {self._hints}",
+        ]
+        for guesses, count in enumerate(self._guess_counts):
+            if count:
+                lines.append(f"  {guesses:2} guesses: {count}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(games={self._games}, "
+            f"wins={self._wins}, hints={self._hints})"
+        )
+
+    def add_game(self, game: MastermindGame) -> None:
+        """
+        Adds a finished game to the results.
+        """
+        self._games += 1
+        self._hints += game.get_used_hints()
+        if game.is_won():
+            self._wins += 1
+            self._guess_counts[game.get_num_guesses()] += 1
+
+    def merge(self, other: "SimulationResult") -> None:
+        """
+        Adds the results of another simulation to these results.
+        """
+        self._games += other._games
+        self._wins += other._wins
+        self._hints += other._hints
+        for guesses, count in enumerate(other._guess_counts):
+            self._guess_counts[guesses] += count
+
+    def get_games(self) -> int:
+        """
+        Returns the number of games played.
+        """
+        return self._games
+
+    def get_wins(self) -> int:
+        """
+        Returns the number of games won.
+        """
+        return self._wins
+
+    def get_hints(self) -> int:
+        """
+        Returns the total number of hints taken.
+        """
+        return self._hints
+
+    def get_guess_counts(self) -> list[int]:
+        """
+        Returns how many games were won in each number of guesses.
+        """
+        return self._guess_counts
+
+    def win_rate(self) -> float:
+        """
+        Returns the fraction of games won.
+        """
+        return self._wins / self._games if self._games else 0.0
+
+    def mean_guesses(self) -> float:
+        """
+        Returns the mean number of guesses taken to win a won game.
+        """
+        total = sum(n * count for n, count in enumerate(self._guess_counts))
+        return total / self._wins if self._wins else 0.0
+
+
+def play(
+    game: MastermindGame, solver: Solver, hint_turns: tuple[int, ...] = ()
+) -> None:
+    """
+    Plays a game to the end with the given solver.
+
+    Parameters:
+        game (MastermindGame): A new game.
+        solver (Solver): The solver to choose guesses with.
+        hint_turns (tuple[int, ...]): For each hint to take, the number of
+            guesses after which to take it, in ascending order. Hints are
+            passed on to the solver as constraints.
+    """
+    solver.reset()
+    hints_taken = 0
+    while not game.is_over():
+        while (
+            hints_taken < len(hint_turns)
+            and game.get_num_guesses() >= hint_turns[hints_taken]
+            and game.hint()
+        ):
+            hints_taken += 1
+            solver.record_hint(game.get_revealed())
+        guess_code = solver.next_guess()
+        solver.record(guess_code, game.step(guess_code))
+
+
+# Per-process solver, so decisions stay cached across chunks
+_worker_solver: Solver | None = None
+
+
+def _init_worker(strategy: str) -> None:
+    global _worker_solver
+    _worker_solver = Solver(strategy, candidates_only=True)
+
+
+def _run_chunk(
+    args: tuple[int, int, int, tuple[int, ...]]
+) -> SimulationResult:
+    seed, start, stop, hint_turns = args
+    assert _worker_solver is not None
+    result = SimulationResult()
+    keys = KeyStream(seed, start // CHUNK_SIZE).codes(stop - start)
+    for key_code in keys:
+        game = MastermindGame(key_code)
+        play(game, _worker_solver, hint_turns)
+        result.add_game(game)
+    return result
+
+
+def simulate(
+    num_games: int,
+    seed: int = DEFAULT_SEED,
+    strategy: str = EXPECTED_SIZE,
+    use_hints: bool = False,
+    processes: int | None = None,
+) -> SimulationResult:
+    """
+    Plays num_games seeded games across a process pool.
+
+    Parameters:
+        num_games (int): The number of games to play.
+        seed (int): The seed that keys are drawn from.
+        strategy (str): The solver strategy, one of `solver.STRATEGIES`.
+        use_hints (bool): Whether to take every hint as soon as it is allowed.
+        processes (int | None): Worker processes. Defaults to the CPU count.
+                                1 plays every game in this process.
+
+    Returns:
+        (SimulationResult): The aggregated results.
+    """
+    hint_turns = EARLIEST_HINTS if use_hints else ()
+    chunks = [
+        (seed, start, min(start + CHUNK_SIZE, num_games), hint_turns)
+        for start in range(0, num_games, CHUNK_SIZE)
+    ]
+    result = SimulationResult()
+    if processes == 1:
+        _init_worker(strategy)
+        for chunk in chunks:
+            result.merge(_run_chunk(chunk))
+        return result
+
+    with Pool(processes or cpu_count(), _init_worker, (strategy,)) as pool:
+        for chunk_result in pool.imap_unordered(_run_chunk, chunks):
+            result.merge(chunk_result)
+    return result
+
+
+def main() -> None:
+    """
+    Runs a simulation from the command line and prints its results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--strategy", choices=STRATEGIES, default=EXPECTED_SIZE
+    )
+    parser.add_argument("--hints", action="store_true")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    print(
+        simulate(
+            args.games, args.seed, args.strategy, args.hints, args.processes
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Mastermind solver built on the integer scoring engine in `scoring`.
+
+The solver keeps the codes that are still consistent with every feedback row
+as a compact array of integer codes, prunes it once per new feedback row, and
+chooses the next guess by partitioning the remaining candidates.
+"""
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import compress
+from operator import itemgetter
+
+from a1 import MAX_ROWS
+from scoring import (
+    CODE_SPACE,
+    DEFAULT_TABLE,
+    WIN_SCORE,
+    FeedbackTable,
+    batch_scores,
+    encode_digits,
+)
+from support import MAX_NUMBER, NUM_NUMBERS
+
+MINIMAX = "minimax"  # Knuth: minimise the largest remaining partition
+EXPECTED_SIZE = "expected"  # minimise the expected remaining partition size
+STRATEGIES = (MINIMAX, EXPECTED_SIZE)
+
+FIRST_GUESS = encode_digits((1, 1, 2, 2, 3))
+ALL_CODES = array("H", range(CODE_SPACE))
+
+
+def _select(row: bytes, codes: array) -> tuple[int, ...]:
+    """
+    Returns row[code] for each code, in order.
+    """
+    if len(codes) == 1:
+        return (row[codes[0]],)
+    return itemgetter(*codes)(row)
+
+
+class CandidateSet:
+    """
+    The codes still consistent with all feedback seen so far, stored as an
+    array of unsigned 16-bit codes.
+    """
+
+    def __init__(self, codes: array = ALL_CODES) -> None:
+        """
+        Parameters:
+            codes (array): The initial candidate codes. Defaults to every code.
+        """
+        self._codes = array("H", codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self):
+        return iter(self._codes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._codes)} codes)"
+
+    def get_codes(self) -> array:
+        """
+        Returns the candidate codes, in ascending order.
+        """
+        return self._codes
+
+    def prune(
+        self, guess_code: int, score: int, table: FeedbackTable = DEFAULT_TABLE
+    ) -> None:
+        """
+        Removes every candidate that would not have produced the given score
+        for the given guess.
+
+        Parameters:
+            guess_code (int): The integer code of the guess.
+            score (int): The packed feedback score received for the guess.
+            table (FeedbackTable): The table to score with.
+        """
+        if not self._codes:
+            return
+        matches = map(
+            score.__eq__, _select(table.row(guess_code), self._codes)
+        )
+        self._codes = array("H", compress(self._codes, matches))
+
+    def fix_prefix(self, revealed: tuple[int, ...]) -> None:
+        """
+        Removes every candidate that does not start with the numbers revealed
+        by hints.
+
+        Codes starting with the same numbers form one contiguous range, so
+        this is a slice of the (sorted) candidates.
+
+        Parameters:
+            revealed (tuple[int, ...]): The first numbers of the key.
+        """
+        span = MAX_NUMBER ** (NUM_NUMBERS - len(revealed))
+        low = encode_digits(revealed) * span
+        start = bisect_left(self._codes, low)
+        end = bisect_left(self._codes, low + span)
+        self._codes = self._codes[start:end]
+
+
+class Solver:
+    """
+    Chooses guesses for a game of Mastermind.
+
+    Decisions are cached by feedback history, so a Solver reused across games
+    (via `reset`) only partitions each distinct position once. Pruning is
+    deferred until a decision is not in the cache.
+
+    Hints are recorded in the history as (-number revealed, code of the
+    revealed numbers), so they can never be mistaken for a guess.
+    """
+
+    def __init__(
+        self,
+        strategy: str = MINIMAX,
+        table: FeedbackTable = DEFAULT_TABLE,
+        first_guess: int = FIRST_GUESS,
+        candidates_only: bool = False,
+    ) -> None:
+        """
+        Parameters:
+            strategy (str): One of STRATEGIES.
+            table (FeedbackTable): The table to score with.
+            first_guess (int): The code to open every game with.
+            candidates_only (bool): Only consider guesses that could be the
+                                    key. Much faster, slightly weaker.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self._strategy = strategy
+        self._table = table
+        self._candidates_only = candidates_only
+        self._cache: dict[tuple[tuple[int, int], ...], int] = {(): first_guess}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts a new game, keeping cached decisions.
+        """
+        self._history: list[tuple[int, int]] = []
+        self._revealed: list[tuple[int, ...]] = []
+        self._pruned = 0
+        self._candidates = CandidateSet()
+
+    def get_table(self) -> FeedbackTable:
+        """
+        Returns the table this solver scores with.
+        """
+        return self._table
+
+    def get_history(self) -> list[tuple[int, int]]:
+        """
+        Returns the (guess code, score) pairs and hints recorded this game.
+        """
+        return self._history
+
+    def get_candidates(self) -> CandidateSet:
+        """
+        Returns the codes still consistent with every recorded feedback row.
+        """
+        pruned = self._pruned
+        for guess_code, score in self._history[pruned:]:
+            if guess_code < 0:
+                revealed = self._revealed[-guess_code - 1]
+                self._candidates.fix_prefix(revealed)
+            else:
+                self._candidates.prune(guess_code, score, self._table)
+        self._pruned = len(self._history)
+        return self._candidates
+
+    def record(self, guess_code: int, score: int) -> None:
+        """
+        Records the feedback received for a guess.
+
+        Parameters:
+            guess_code (int): The integer code of the guess.
+            score (int): The packed feedback score received for it.
+        """
+        self._history.append((guess_code, score))
+
+    def record_hint(self, revealed: tuple[int, ...]) -> None:
+        """
+        Records the numbers of the key revealed by a hint.
+
+        Parameters:
+            revealed (tuple[int, ...]): Every number revealed so far, i.e. the
+                                        first len(revealed) numbers of the key.
+        """
+        self._revealed.append(revealed)
+        self._history.append((-len(revealed), encode_digits(revealed)))
+
+    def next_guess(self) -> int:
+        """
+        Returns the code of the best next guess under the solver's strategy.
+        """
+        history = tuple(self._history)
+        guess = self._cache.get(history)
+        if guess is None:
+            codes = self.get_candidates().get_codes()
+            guess = self._cache[history] = self._choose(codes)
+        return guess
+
+    def decide(
+        self, history: tuple[tuple[int, int], ...], codes: array
+    ) -> int:
+        """
+        Returns the best next guess after the given history, without playing
+        a game. Shares the cache with next_guess.
+
+        Parameters:
+            history (tuple[tuple[int, int], ...]): Guesses and hints, in the
+                format of get_history.
+            codes (array): The codes consistent with the history, ascending.
+        """
+        guess = self._cache.get(history)
+        if guess is None:
+            guess = self._cache[history] = self._choose(codes)
+        return guess
+
+    def _choose(self, codes: array) -> int:
+        """
+        Partitions the candidates by every possible guess and returns the guess
+        with the best partition, preferring candidates and then lower codes.
+        """
+        if not codes:
+            raise ValueError("No code is consistent with the feedback given")
+        if len(codes) <= 2:
+            return codes[0]
+
+        pool = codes if self._candidates_only else ALL_CODES
+        is_candidate = bytearray(CODE_SPACE)
+        for code in codes:
+            is_candidate[code] = 1
+
+        num_codes = len(codes)
+        scores = batch_scores(list(pool), list(codes), self._table)
+        best_guess = pool[0]
+        best_cost: tuple[float, int] | None = None
+        for i, guess_code in enumerate(pool):
+            start = i * num_codes
+            end = start + num_codes
+            sizes = Counter(scores[start:end]).values()
+            if self._strategy == MINIMAX:
+                cost = max(sizes)
+            else:
+                cost = sum(size * size for size in sizes) / num_codes
+            key = (cost, not is_candidate[guess_code])
+            if best_cost is None or key < best_cost:
+                best_cost = key
+                best_guess = guess_code
+        return best_guess
+
+
+def solve(
+    key_code: int, solver: Solver, max_rows: int = MAX_ROWS
+) -> list[int]:
+    """
+    Plays one game against the given key.
+
+    Parameters:
+        key_code (int): The integer code of the secret key.
+        solver (Solver): The solver to play with. It is reset first.
+        max_rows (int): The number of guesses allowed.
+
+    Returns:
+        (list[int]): The codes guessed, ending with key_code if the game
+                     was won.
+    """
+    solver.reset()
+    table = solver.get_table()
+    guesses = []
+    while len(guesses) < max_rows:
+        guess_code = solver.next_guess()
+        guesses.append(guess_code)
+        score = table.row(guess_code)[key_code]
+        if score == WIN_SCORE:
+            break
+        solver.record(guess_code, score)
+    return guesses
@@ -37,6 +37,8 @@ LOST_MESSAGE = "\nSorry, you've lost the game."
 HINT_MESSAGE = "\nSorry, you've used all hints."
 HINT_EARLY_MESSAGE = "\nYou can get hint after attempting 3 guesses!"
 
+KEY_NUMBERS = tuple(f"[{num + 1}]" for num in range(MAX_NUMBER))
+
 
 def generate_key() -> list[str]:
     """
@@ -45,9 +47,5 @@ def generate_key() -> list[str]:
     Returns:
         (list[str]): The generated secret key.
     """
-    numbers = []
-    for num in range(MAX_NUMBER):
-        numbers.append(f"[{num + 1}]")
-
-    key = choices(numbers, k=MAX_NUMBER)
+    key = choices(KEY_NUMBERS, k=NUM_NUMBERS)
     return key
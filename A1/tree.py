@@ -0,0 +1,274 @@
+"""
+Precomputed decision tree for the standard game.
+
+The solver's choices for NUM_NUMBERS slots of MAX_NUMBER numbers are fixed,
+so its whole strategy is a finite tree: each node is a guess, with one child
+per feedback score that guess can receive. `build_tree` computes the tree
+once, building the subtrees below the first guess in parallel, and writes it
+to a compact binary file. A TreePlayer memory-maps that file and follows it,
+so each move is a lookup rather than a search.
+
+File format (little endian):
+    b"MMDT\\x01"
+    node: guess code (uint16), number of children (uint8), then for each
+          child its score (uint8) and its offset from the start of this
+          node (uint32).
+The root node follows the header and children follow their parent. Offsets
+are relative, so subtrees built by separate workers are concatenated as is.
+
+Usage:
+    python3 tree.py build [--strategy expected] [--out mastermind.tree]
+    python3 tree.py check [--tree mastermind.tree]
+"""
+import argparse
+import mmap
+import struct
+from array import array
+from multiprocessing import Pool
+
+from scoring import DEFAULT_TABLE, WIN_SCORE
+from solver import ALL_CODES, EXPECTED_SIZE, STRATEGIES, Solver
+
+MAGIC = b"MMDT\x01"
+NODE = struct.Struct("<HB")
+CHILD = struct.Struct("<BI")
+DEFAULT_TREE = "mastermind.tree"
+
+History = tuple[tuple[int, int], ...]
+
+
+def _group_by_score(guess_code: int, keys: array) -> dict[int, array]:
+    """
+    Splits keys by the score the guess receives against each of them.
+    """
+    row = DEFAULT_TABLE.row(guess_code)
+    groups: dict[int, array] = {}
+    for code in keys:
+        groups.setdefault(row[code], array("H")).append(code)
+    return groups
+
+
+def _encode_node(guess_code: int, children: dict[int, bytes]) -> bytes:
+    """
+    Encodes a node and its already encoded subtrees.
+
+    Parameters:
+        guess_code (int): The code guessed at this node.
+        children (dict[int, bytes]): The encoded subtree for each score,
+                                     excluding the winning score.
+
+    Returns:
+        (bytes): The node followed by its subtrees.
+    """
+    header = bytearray(NODE.pack(guess_code, len(children)))
+    offset = NODE.size + CHILD.size * len(children)
+    for score, subtree in sorted(children.items()):
+        header += CHILD.pack(score, offset)
+        offset += len(subtree)
+    return b"".join([header, *(children[s] for s in sorted(children))])
+
+
+def _build(solver: Solver, keys: array, history: History) -> bytes:
+    """
+    Builds the subtree for the position reached by history.
+
+    Parameters:
+        solver (Solver): The solver choosing guesses.
+        keys (array): The keys consistent with history, ascending.
+        history (History): Guesses so far, as `Solver.get_history`.
+
+    Returns:
+        (bytes): The encoded subtree.
+    """
+    guess = solver.decide(history, keys)
+    children = {}
+    for score, group in _group_by_score(guess, keys).items():
+        if score != WIN_SCORE:
+            children[score] = _build(
+                solver, group, history + ((guess, score),)
+            )
+    return _encode_node(guess, children)
+
+
+# Per-process solver, so positions shared between branches are cached
+_worker_solver: Solver | None = None
+
+
+def _init_worker(strategy: str) -> None:
+    global _worker_solver
+    _worker_solver = Solver(strategy)
+
+
+def _build_branch(branch: tuple[History, array]) -> bytes:
+    assert _worker_solver is not None
+    history, keys = branch
+    return _build(_worker_solver, keys, history)
+
+
+def build_tree(
+    path: str = DEFAULT_TREE,
+    strategy: str = EXPECTED_SIZE,
+    processes: int | None = None,
+) -> int:
+    """
+    Computes the solver's decision tree and writes it to a file.
+
+    Parameters:
+        path (str): The file to write.
+        strategy (str): The solver strategy, one of `solver.STRATEGIES`.
+        processes (int | None): Worker processes. Defaults to the CPU count.
+
+    Returns:
+        (int): The size of the file in bytes.
+    """
+    solver = Solver(strategy)
+    guess = solver.decide((), ALL_CODES)
+    groups = _group_by_score(guess, ALL_CODES)
+    groups.pop(WIN_SCORE, None)
+    scores = sorted(groups)
+    branches = [(((guess, score),), groups[score]) for score in scores]
+    with Pool(processes, _init_worker, (strategy,)) as pool:
+        subtrees = pool.map(_build_branch, branches)
+    data = MAGIC + _encode_node(guess, dict(zip(scores, subtrees)))
+    with open(path, "wb") as file:
+        file.write(data)
+    return len(data)
+
+
+class TreePlayer:
+    """
+    Plays from a decision tree file without recomputing anything.
+
+    Has the reset / next_guess / record interface of `solver.Solver`.
+    """
+
+    def __init__(self, path: str = DEFAULT_TREE) -> None:
+        """
+        Parameters:
+            path (str): A file written by build_tree.
+        """
+        with open(path, "rb") as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[: len(MAGIC)] != MAGIC:
+            self._data.close()
+            raise ValueError(f"{path} is not a decision tree file")
+        self._path = path
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    def __enter__(self) -> "TreePlayer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the tree file.
+        """
+        self._data.close()
+
+    def reset(self) -> None:
+        """
+        Starts a new game at the root of the tree.
+        """
+        self._node = len(MAGIC)
+
+    def next_guess(self) -> int:
+        """
+        Returns the code to guess at the current position.
+        """
+        return NODE.unpack_from(self._data, self._node)[0]
+
+    def record(self, guess_code: int, score: int) -> None:
+        """
+        Moves to the position reached by the feedback for the last guess.
+
+        Parameters:
+            guess_code (int): The integer code of the guess, which must be the
+                              one returned by next_guess.
+            score (int): The packed feedback score received for it.
+        """
+        guess, num_children = NODE.unpack_from(self._data, self._node)
+        if guess_code != guess:
+            raise ValueError("Guess was not chosen from this tree")
+        position = self._node + NODE.size
+        for _ in range(num_children):
+            child_score, offset = CHILD.unpack_from(self._data, position)
+            if child_score == score:
+                self._node += offset
+                return
+            position += CHILD.size
+        raise ValueError("No code is consistent with the feedback given")
+
+    def lookup(self, scores: list[int]) -> int:
+        """
+        Returns the code to guess after the given feedback, walking from the
+        root in O(len(scores)).
+
+        Parameters:
+            scores (list[int]): The packed score received for each guess so
+                                far, in order.
+        """
+        self.reset()
+        for score in scores:
+            self.record(self.next_guess(), score)
+        return self.next_guess()
+
+
+def check_tree(path: str = DEFAULT_TREE) -> list[int]:
+    """
+    Plays the tree against every key.
+
+    Returns:
+        (list[int]): The number of keys won after each number of guesses.
+    """
+    counts = [0]
+    with TreePlayer(path) as player:
+        for key_code in ALL_CODES:
+            player.reset()
+            guesses = 0
+            while True:
+                guess = player.next_guess()
+                guesses += 1
+                score = DEFAULT_TABLE.row(guess)[key_code]
+                if score == WIN_SCORE:
+                    break
+                player.record(guess, score)
+            counts += [0] * (guesses + 1 - len(counts))
+            counts[guesses] += 1
+    return counts
+
+
+def main() -> None:
+    """
+    Builds or checks a decision tree file.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build")
+    build.add_argument("--strategy", choices=STRATEGIES, default=EXPECTED_SIZE)
+    build.add_argument("--out", default=DEFAULT_TREE)
+    build.add_argument("--processes", type=int, default=None)
+    check = commands.add_parser("check")
+    check.add_argument("--tree", default=DEFAULT_TREE)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        size = build_tree(args.out, args.strategy, args.processes)
+        print(f"Wrote {size} bytes to {args.out}")
+        return
+    counts = check_tree(args.tree)
+    games = sum(counts)
+    total = sum(guesses * count for guesses, count in enumerate(counts))
+    print(f"Keys: {games}")
+    print(f"Mean guesses to win: {total / games:.4f}")
+    for guesses, count in enumerate(counts):
+        if count:
+            print(f"  {guesses:2} guesses: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -68,18 +68,48 @@ DECK_SEP = "; "
 COOL_SEP = ", "
 SHIP_SEP = ","
 
+# A card effect compiled to (shield, heat, damage), where damage is None if
+# the card does not target a hardpoint
+Effect = tuple[int, int, Optional[int]]
+NO_EFFECT: Effect = (0, 0, None)
+
+
+def compile_effect(effect: dict[str, int]) -> Effect:
+    """
+    Return a card effect dictionary compiled to an Effect tuple.
+
+    Parameters:
+        effect (dict[str, int]): The effect, as returned by get_effect.
+    """
+    return effect.get(SHIELD, 0), effect.get(HEAT, 0), effect.get(DAMAGE)
+
 
 class Card:
     """
     An abstract card representing a basic action in the Breachway game.
+
+    A card's definition (name, cost, cooldown and effect) is held by its
+    class and shared by every instance, so a card object is only a handle
+    with no per-instance state. Hardpoints still create a handle per card,
+    which keeps each card in a deck a distinct object as `shuffle_cards`
+    requires. get_effect returns a copy, so the shared effect cannot be
+    changed through a card.
+
+    Each class's effect is also compiled once, when the class is defined,
+    to the Effect tuple that play_card and end_turn apply.
     """
 
-    def __init__(self) -> None:
-        self._name = CARD_NAME
-        self._desc = CARD_DESC
-        self._cost = 1
-        self._cooldown = 1
-        self._effect = {}
+    __slots__ = ()
+    _name = CARD_NAME
+    _desc = CARD_DESC
+    _cost = 1
+    _cooldown = 1
+    _effect: dict[str, int] = {}
+    _compiled: Effect = NO_EFFECT
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compiled = compile_effect(cls._effect)
 
     def __str__(self) -> str:
         return f"{self._name}: {self._desc}"
@@ -107,9 +137,15 @@ class Card:
 
     def get_effect(self) -> dict[str, int]:
         """
-        Returns the effect of this card.
+        Returns a copy of the effect of this card.
         """
-        return self._effect
+        return dict(self._effect)
+
+    def get_compiled_effect(self) -> Effect:
+        """
+        Returns the effect of this card as a (shield, heat, damage) tuple.
+        """
+        return self._compiled
 
 
 class SmallBlast(Card):
@@ -118,11 +154,10 @@ class SmallBlast(Card):
     and deal 1 damage.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._name = SB_NAME
-        self._desc = SB_DESC
-        self._effect = {DAMAGE: 1}
+    __slots__ = ()
+    _name = SB_NAME
+    _desc = SB_DESC
+    _effect = {DAMAGE: 1}
 
 
 class BigBlast(Card):
@@ -131,13 +166,12 @@ class BigBlast(Card):
     deal 5 damage, and apply 3 heat.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._name = BB_NAME
-        self._desc = BB_DESC
-        self._cost = 3
-        self._cooldown = 4
-        self._effect = {DAMAGE: 5, HEAT: 3}
+    __slots__ = ()
+    _name = BB_NAME
+    _desc = BB_DESC
+    _cost = 3
+    _cooldown = 4
+    _effect = {DAMAGE: 5, HEAT: 3}
 
 
 class RaiseShield(Card):
@@ -146,13 +180,12 @@ class RaiseShield(Card):
     apply 2 shield, and apply 2 heat.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._name = RS_NAME
-        self._desc = RS_DESC
-        self._cost = 1
-        self._cooldown = 2
-        self._effect = {SHIELD: 5}
+    __slots__ = ()
+    _name = RS_NAME
+    _desc = RS_DESC
+    _cost = 1
+    _cooldown = 2
+    _effect = {SHIELD: 5}
 
 
 class LeechEnergy(Card):
@@ -161,13 +194,12 @@ class LeechEnergy(Card):
     apply 2 shield, and apply 2 heat.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._name = LE_NAME
-        self._desc = LE_DESC
-        self._cost = 2
-        self._cooldown = 3
-        self._effect = {SHIELD: 2, HEAT: 2}
+    __slots__ = ()
+    _name = LE_NAME
+    _desc = LE_DESC
+    _cost = 2
+    _cooldown = 3
+    _effect = {SHIELD: 2, HEAT: 2}
 
 
 class CardDeck:
@@ -180,10 +212,25 @@ class CardDeck:
         """
         Initialise a new CardDeck with the given cards and their cooldowns.
 
+        Cards are numbered in the order they enter the deck, and ready cards
+        are always drawn in that order. Ready cards are kept with the newest
+        first, so drawing pops from the end of the list. Cooling cards are
+        bucketed by the turn they become ready on, so advancing a turn only
+        touches the one bucket that becomes ready.
+
         Parameters:
             cards (list[tuple[Card, int]]): A list of (card, cooldown) pairs.
         """
-        self._cards = cards
+        self._turn = 0
+        self._next_seq = len(cards)
+        self._ready: list[tuple[int, Card]] = []
+        self._cooling: dict[int, list[tuple[int, Card]]] = {}
+        for seq, (card, cooldown) in enumerate(cards):
+            if cooldown > 0:
+                self._cooling.setdefault(cooldown, []).append((seq, card))
+            else:
+                self._ready.append((seq, card))
+        self._ready.reverse()
 
     def _make_group(self) -> dict[int, list[Card]]:
         """
@@ -194,11 +241,11 @@ class CardDeck:
             cards.
         """
         group = {}
-        for card, cooldown in self._cards:
-            if cooldown not in group:
-                group[cooldown] = [card]
-            else:
-                group[cooldown].append(card)
+        if self._ready:
+            group[0] = [card for _, card in reversed(self._ready)]
+        for ready_turn in sorted(self._cooling):
+            entries = self._cooling[ready_turn]
+            group[ready_turn - self._turn] = [card for _, card in entries]
 
         return group
 
@@ -251,18 +298,10 @@ class CardDeck:
             list[Card]: A list of drawn cards.
         """
         cards = []
-        new_cards = []
-        for card, cooldown in self._cards:
-            if num_cards > 0:  # early stopping
-                if cooldown == 0:
-                    cards.append(card)
-                    num_cards -= 1
-                else:
-                    new_cards.append((card, cooldown))
-            else:
-                new_cards.append((card, cooldown))
+        while num_cards > 0 and self._ready:
+            cards.append(self._ready.pop()[1])
+            num_cards -= 1
 
-        self._cards = new_cards
         return cards
 
     def add_card(self, card: Card) -> None:
@@ -273,17 +312,187 @@ class CardDeck:
         Parameters:
             card (Card): The card to add.
         """
-        self._cards.append((card, card.get_cooldown()))
+        entry = (self._next_seq, card)
+        self._next_seq += 1
+        cooldown = card.get_cooldown()
+        if cooldown > 0:
+            self._cooling.setdefault(self._turn + cooldown, []).append(entry)
+        else:
+            # Newer than every ready card, so it is drawn last
+            self._ready.insert(0, entry)
 
     def advance_cards(self) -> None:
         """
         Decrease the cooldown of all non-ready cards by 1 turn.
         """
-        new_cards = []
-        for card, cooldown in self._cards:
-            new_cards.append((card, max(0, cooldown - 1)))
+        self._turn += 1
+        newly_ready = self._cooling.pop(self._turn, None)
+        if newly_ready:
+            # Both lists are already sorted, which sorted() merges in one pass
+            self._ready = sorted(self._ready + newly_ready, reverse=True)
+
+    def write_state(self, state: list[int], card_ids: dict[int, int]) -> None:
+        """
+        Append this deck's state to a flat list of integers: the turn, the
+        next card number, the number of cards, then (card number, turn it is
+        ready on, card id) for each card.
+
+        Parameters:
+            state (list[int]): The state to append to.
+            card_ids (dict[int, int]): Maps id(card) to the card's id.
+        """
+        state += (self._turn, self._next_seq)
+        state.append(len(self._ready) + sum(map(len, self._cooling.values())))
+        for seq, card in self._ready:
+            state += (seq, self._turn, card_ids[id(card)])
+        for ready_turn, entries in self._cooling.items():
+            for seq, card in entries:
+                state += (seq, ready_turn, card_ids[id(card)])
+
+    def read_state(
+        self, state: tuple[int, ...], index: int, cards: list[Card]
+    ) -> int:
+        """
+        Restore this deck from state written by write_state.
+
+        Parameters:
+            state (tuple[int, ...]): The state to read from.
+            index (int): Where this deck's state starts.
+            cards (list[Card]): The card for each card id.
+
+        Returns:
+            int: Where the state after this deck's starts.
+        """
+        end = index + 3
+        self._turn, self._next_seq, num_cards = state[index:end]
+        self._ready = []
+        self._cooling = {}
+        for start in range(end, end + 3 * num_cards, 3):
+            end = start + 3
+            seq, ready_turn, card_id = state[start:end]
+            entry = (seq, cards[card_id])
+            if ready_turn <= self._turn:
+                self._ready.append(entry)
+            else:
+                self._cooling.setdefault(ready_turn, []).append(entry)
+        return end
+
+
+class Hand:
+    """
+    The cards in the player's hand, in the order they were drawn.
+
+    Each card sits in a slot that does not move while it is in the hand, so
+    removing a card only empties its slot, however large the hand. Slots
+    are in draw order, and empty slots are dropped when cards are added
+    once at least half of the slots are empty. The cards without the empty
+    slots are listed when first asked for after a change.
+    """
+
+    def __init__(self, max_size: int = MAX_HAND) -> None:
+        """
+        Initialise an empty hand.
+
+        Parameters:
+            max_size (int): The most cards the hand is refilled to.
+        """
+        self._max_size = max_size
+        self._slots: list[Optional[Card]] = []
+        self._slot_of: dict[int, int] = {}  # id(card) -> slot
+        self._cards: Optional[list[Card]] = []  # cards in order, if current
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._max_size})"
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def get_max_size(self) -> int:
+        """
+        Return the most cards the hand is refilled to.
+        """
+        return self._max_size
+
+    def get_space(self) -> int:
+        """
+        Return the number of cards needed to refill the hand.
+        """
+        return max(self._max_size - len(self._slot_of), 0)
+
+    def get_slots(self) -> list[Optional[Card]]:
+        """
+        Return the hand's slots in draw order, each a card or None if its
+        card was removed. A card keeps its slot until cards are next added.
+        """
+        return self._slots
+
+    def set_slots(self, slots: list[Optional[Card]]) -> None:
+        """
+        Replace the hand's slots, as returned by get_slots.
+
+        Parameters:
+            slots (list[Optional[Card]]): Each slot's card, or None if empty.
+        """
+        self._slots = slots
+        self._slot_of = {
+            id(card): slot
+            for slot, card in enumerate(slots)
+            if card is not None
+        }
+        self._cards = None
+
+    def get_cards(self) -> list[Card]:
+        """
+        Return the cards in the hand, in the order they were drawn.
+        """
+        if self._cards is None:
+            # Cards are always true, so this drops only the empty slots
+            self._cards = list(filter(None, self._slots))
+        return self._cards
 
-        self._cards = new_cards
+    def add_cards(self, cards: list[Card]) -> None:
+        """
+        Add cards to the end of the hand.
+
+        Parameters:
+            cards (list[Card]): The cards to add, each a distinct object.
+        """
+        if not cards:
+            return
+        if 2 * len(self._slot_of) <= len(self._slots):
+            self._slots = list(self.get_cards())
+            self._slot_of = {
+                id(card): slot for slot, card in enumerate(self._slots)
+            }
+        for card in cards:
+            self._slot_of[id(card)] = len(self._slots)
+            self._slots.append(card)
+        self._cards = None
+
+    def remove_card(self, card: Card) -> bool:
+        """
+        Remove a card from the hand.
+
+        Parameters:
+            card (Card): The card to remove.
+
+        Returns:
+            bool: Whether the card was in the hand.
+        """
+        slot = self._slot_of.pop(id(card), None)
+        if slot is None:
+            return False
+        self._slots[slot] = None
+        self._cards = None
+        return True
+
+    def clear(self) -> None:
+        """
+        Remove every card from the hand.
+        """
+        self._slots = []
+        self._slot_of = {}
+        self._cards = []
 
 
 class HardPoint:
@@ -342,6 +551,24 @@ class HardPoint:
         """
         self._health = self._max_health
 
+    def _next_card(self) -> Optional[Card]:
+        """
+        Advance to the next card for enemy action and return the card played.
+
+        Returns:
+            Optional[Card]: The selected card, or None if it plays nothing
+                (e.g. it is destroyed).
+        """
+        if not self.is_functional():
+            return None
+
+        card = self._cards[self._enemy_card_no]
+        self._enemy_card_no += 1
+
+        if self._enemy_card_no >= len(self._cards):
+            self._enemy_card_no = 0
+        return card
+
     def enemy_action(self) -> dict[str, int]:
         """
         Return the effect of the next card for enemy action.
@@ -351,15 +578,18 @@ class HardPoint:
         Returns:
             dict[str, int]: The effect of the selected card or {} if destroyed.
         """
-        if not self.is_functional():
-            return {}
+        card = self._next_card()
+        return {} if card is None else card.get_effect()
 
-        effect = self._cards[self._enemy_card_no].get_effect()
-        self._enemy_card_no += 1
+    def enemy_compiled_action(self) -> Effect:
+        """
+        Return the compiled effect of the next card for enemy action.
 
-        if self._enemy_card_no >= len(self._cards):
-            self._enemy_card_no = 0
-        return effect
+        Returns:
+            Effect: The effect of the selected card or NO_EFFECT if destroyed.
+        """
+        card = self._next_card()
+        return NO_EFFECT if card is None else card.get_compiled_effect()
 
     def enemy_intent(self) -> str:
         """
@@ -373,6 +603,24 @@ class HardPoint:
         else:
             return str(self._cards[self._enemy_card_no])
 
+    def get_cycle(self) -> int:
+        """
+        Return the position of this hardpoint in its cycle of enemy actions.
+        """
+        return self._enemy_card_no
+
+    def set_state(self, health: int, cycle: int) -> None:
+        """
+        Restore the armour and cycle position of this hardpoint.
+
+        Parameters:
+            health (int): The hardpoint's armour.
+            cycle (int): The hardpoint's position in its cycle, as returned
+                by get_cycle.
+        """
+        self._health = health
+        self._enemy_card_no = cycle
+
 
 class LightLaser(HardPoint):
     """
@@ -450,15 +698,22 @@ class HeavyLaser(HardPoint):
         else:
             return super().enemy_intent()
 
-    def enemy_action(self) -> dict[str, int]:
+    def _next_card(self) -> Optional[Card]:
         if not self.is_functional():
-            return {}
+            return None
         if self._can_fire:
-            effect = self._cards[0].get_effect()
+            card = self._cards[0]
         else:
-            effect = {}
+            card = None
         self._can_fire = not self._can_fire
-        return effect
+        return card
+
+    def get_cycle(self) -> int:
+        return int(self._can_fire)
+
+    def set_state(self, health: int, cycle: int) -> None:
+        self._health = health
+        self._can_fire = bool(cycle)
 
 
 class Ship:
@@ -575,6 +830,37 @@ class Ship:
         for hardpoint in self._hardpoints:
             hardpoint.repair()
 
+    def write_state(self, state: list[int]) -> None:
+        """
+        Append this ship's state to a flat list of integers: armour, heat
+        and shield, then the armour and cycle position of each hardpoint.
+
+        Parameters:
+            state (list[int]): The state to append to.
+        """
+        state += (self._armour, self._heat, self._shield)
+        for hardpoint in self._hardpoints:
+            state += (hardpoint.get_armour(), hardpoint.get_cycle())
+
+    def read_state(self, state: tuple[int, ...], index: int) -> int:
+        """
+        Restore this ship from state written by write_state.
+
+        Parameters:
+            state (tuple[int, ...]): The state to read from.
+            index (int): Where this ship's state starts.
+
+        Returns:
+            int: Where the state after this ship's starts.
+        """
+        end = index + 3
+        self._armour, self._heat, self._shield = state[index:end]
+        index = end
+        for hardpoint in self._hardpoints:
+            hardpoint.set_state(state[index], state[index + 1])
+            index += 2
+        return index
+
     def new_turn(self) -> None:
         """
         Update the ship at the start of a new turn.
@@ -600,6 +886,65 @@ class Ship:
         self._shield //= 2
 
 
+def apply_effect(
+    effect: Effect, user: Ship, opponent: Ship, target: HardPoint
+) -> None:
+    """
+    Apply a compiled card effect played by one ship against another.
+
+    Parameters:
+        effect (Effect): The effect to apply.
+        user (Ship): The ship playing the card, which gains the shield.
+        opponent (Ship): The ship receiving the heat and damage.
+        target (HardPoint): The hardpoint to damage, if the card deals damage.
+    """
+    shield, heat, damage = effect
+    # Zero shield and heat change nothing, so skip the calls
+    if shield:
+        user.apply_shield(shield)
+    if heat:
+        opponent.apply_heat(heat)
+    if damage is not None:
+        opponent.apply_damage(damage, target)
+
+
+def _heap_push(heap: list[tuple[int, int]], item: tuple[int, int]) -> None:
+    """
+    Push an item onto a binary min-heap stored in a list.
+    """
+    heap.append(item)
+    child = len(heap) - 1
+    while child > 0:
+        parent = (child - 1) // 2
+        if heap[parent] <= item:
+            break
+        heap[child] = heap[parent]
+        child = parent
+    heap[child] = item
+
+
+def _heap_pop(heap: list[tuple[int, int]]) -> None:
+    """
+    Remove the smallest item from a binary min-heap stored in a list.
+    """
+    last = heap.pop()
+    if not heap:
+        return
+    size = len(heap)
+    parent = 0
+    while True:
+        child = 2 * parent + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if last <= heap[child]:
+            break
+        heap[parent] = heap[child]
+        parent = child
+    heap[parent] = last
+
+
 class Player(Ship):
     """
     A ship controlled by the player.
@@ -621,6 +966,8 @@ class Player(Ship):
         """
         super().__init__(armour, hardpoints)
         self._energy = initial_energy
+        self._positions = {id(hp): i for i, hp in enumerate(hardpoints)}
+        self._rebuild_targets()
 
     def __str__(self) -> str:
         return super().__str__() + f"{SHIP_SEP}{self._energy}"
@@ -663,12 +1010,77 @@ class Player(Ship):
         else:
             return False
 
+    def _rebuild_targets(self) -> None:
+        """
+        Rebuild the index of functional hardpoints by (armour, position).
+
+        The index is a heap that may hold stale entries: an entry is only
+        current if its hardpoint still has that armour. A new entry is
+        pushed whenever a hardpoint's armour changes.
+        """
+        # A sorted list is already a valid heap
+        self._targets = sorted(
+            (hardpoint.get_armour(), position)
+            for position, hardpoint in enumerate(self._hardpoints)
+            if hardpoint.is_functional()
+        )
+
+    def get_target(self) -> HardPoint:
+        """
+        Return the hardpoint enemies target: the first functional hardpoint
+        with the lowest armour, or the last hardpoint if none are functional.
+        """
+        targets = self._targets
+        while targets:
+            armour, position = targets[0]
+            hardpoint = self._hardpoints[position]
+            if armour > 0 and hardpoint.get_armour() == armour:
+                return hardpoint
+            _heap_pop(targets)
+        return self._hardpoints[-1]
+
+    def _push_target(self, position: int) -> None:
+        """
+        Add the current armour of the hardpoint at position to the index,
+        rebuilding it instead once stale entries outnumber current ones.
+        """
+        if len(self._targets) > 2 * len(self._hardpoints):
+            self._rebuild_targets()
+        else:
+            armour = self._hardpoints[position].get_armour()
+            _heap_push(self._targets, (armour, position))
+
+    def apply_damage(self, damage: int, hardpoint: HardPoint) -> None:
+        super().apply_damage(damage, hardpoint)
+        position = self._positions.get(id(hardpoint))
+        if position is not None and hardpoint.is_functional():
+            self._push_target(position)
+
+    def reset_status(self) -> None:
+        super().reset_status()
+        self._rebuild_targets()
+
     def new_turn(self) -> None:
-        for hardpoint in self._hardpoints:
+        repaired = []
+        for position, hardpoint in enumerate(self._hardpoints):
             if hardpoint.is_functional():
                 self._energy += 1
+            else:
+                repaired.append(position)
 
         super().new_turn()
+        for position in repaired:
+            self._push_target(position)
+
+    def write_state(self, state: list[int]) -> None:
+        state.append(self._energy)
+        super().write_state(state)
+
+    def read_state(self, state: tuple[int, ...], index: int) -> int:
+        self._energy = state[index]
+        index = super().read_state(state, index + 1)
+        self._rebuild_targets()
+        return index
 
 
 class Enemy(Ship):
@@ -685,6 +1097,11 @@ class Enemy(Ship):
     def get_actions(self) -> list[dict[str, int]]:
         return [hardpoint.enemy_action() for hardpoint in self._hardpoints]
 
+    def get_compiled_actions(self) -> list[Effect]:
+        return [
+            hardpoint.enemy_compiled_action() for hardpoint in self._hardpoints
+        ]
+
 
 class BreachModel:
     """
@@ -694,19 +1111,26 @@ class BreachModel:
     such as card play, encounter state, and turn progression.
     """
 
-    def __init__(self, player: Player, enemies: list[Enemy]) -> None:
+    def __init__(
+        self, player: Player, enemies: list[Enemy], max_hand: int = MAX_HAND
+    ) -> None:
         """
         Initialise the BreachModel with the player and list of enemies.
 
         Parameters:
             player (Player): The player's ship.
             enemies (list[Enemy]): A list of enemies to fight in order.
+            max_hand (int): The number of cards the hand is refilled to.
         """
         self._player = player
         self._enemies = enemies
         self._active_enemy = -1
         self._deck: Optional[CardDeck] = None
-        self._hand = []
+        self._hand = Hand(max_hand)
+        # Every card the player's hardpoints provide and their ids, listed
+        # when first needed (see _get_cards)
+        self._cards: Optional[list[Card]] = None
+        self._card_ids: dict[int, int] = {}  # id(card) -> card id
 
     def __str__(self) -> str:
         enemy_part = ENEMY_SEP.join(str(enemy) for enemy in self._enemies)
@@ -745,7 +1169,20 @@ class BreachModel:
         """
         Return the current hand of cards.
         """
-        return self._hand
+        return self._hand.get_cards()
+
+    def get_hand_slots(self) -> list[Optional[Card]]:
+        """
+        Return the slots of the current hand (see Hand.get_slots), which can
+        be indexed without listing the hand after every card played.
+        """
+        return self._hand.get_slots()
+
+    def get_max_hand(self) -> int:
+        """
+        Return the number of cards the hand is refilled to.
+        """
+        return self._hand.get_max_size()
 
     def get_enemies(self) -> list[Enemy]:
         """
@@ -790,7 +1227,8 @@ class BreachModel:
 
         self._player.reset_status()
         self._deck = self._player.build_deck()
-        self._hand: list[Card] = self._deck.draw_cards(MAX_HAND)
+        self._hand.clear()
+        self._hand.add_cards(self._deck.draw_cards(self._hand.get_max_size()))
 
     def encounter_ongoing(self) -> bool:
         """
@@ -809,24 +1247,18 @@ class BreachModel:
         success = self._player.spend_energy(card.get_cost())
         if success:
             # remove card from hand
-            new_hand = []
-            removal_accomplished = False
-            for existing_card in self._hand:
-                if existing_card == card and not removal_accomplished:
-                    removal_accomplished = True
-                else:
-                    new_hand.append(existing_card)
-            self._hand = new_hand
+            self._hand.remove_card(card)
 
             opponent = self.get_active_enemy()
             assert opponent is not None
 
             # apply effects
-            action = card.get_effect()
-            self._player.apply_shield(action.get(SHIELD, 0))
-            opponent.apply_heat(action.get(HEAT, 0))
-            if DAMAGE in action:
-                opponent.apply_damage(action[DAMAGE], target_hardpoint)
+            apply_effect(
+                card.get_compiled_effect(),
+                self._player,
+                opponent,
+                target_hardpoint,
+            )
 
             # Send card to cooldown
             assert self._deck is not None
@@ -842,23 +1274,17 @@ class BreachModel:
         opponent = self.get_active_enemy()
         assert opponent is not None
 
-        for action in opponent.get_actions():
-            opponent.apply_shield(action.get(SHIELD, 0))
-            self._player.apply_heat(action.get(HEAT, 0))
+        player = self._player
+        for shield, heat, damage in opponent.get_compiled_actions():
+            # As apply_effect, but only finding a target for damage
+            if shield:
+                opponent.apply_shield(shield)
+            if heat:
+                player.apply_heat(heat)
 
-            if DAMAGE in action:
+            if damage is not None:
                 # AI always targets hardpoint with lowest health (tie early)
-                min_health = min(
-                    hardpoint.get_armour()
-                    for hardpoint in self._player.get_hardpoints()
-                    if hardpoint.is_functional()
-                )
-                target = self._player.get_hardpoints()[-1]
-                for hardpoint in self._player.get_hardpoints():
-                    if hardpoint.get_armour() == min_health:
-                        target = hardpoint
-                        break
-                self._player.apply_damage(action[DAMAGE], target)
+                player.apply_damage(damage, player.get_target())
 
         # Begin new turn
         self._player.new_turn()
@@ -866,7 +1292,176 @@ class BreachModel:
 
         assert self._deck is not None
         self._deck.advance_cards()
-        self._hand += self._deck.draw_cards(MAX_HAND - len(self._hand))
+        self._hand.add_cards(self._deck.draw_cards(self._hand.get_space()))
+
+    def _get_cards(self) -> list[Card]:
+        """
+        Return every card the player's hardpoints provide, which are the only
+        cards the deck and hand ever hold. A card's id in a snapshot is its
+        position in this list.
+        """
+        if self._cards is None:
+            self._cards = []
+            for hardpoint in self._player.get_hardpoints():
+                self._cards += hardpoint.get_cards()
+            self._card_ids = {
+                id(card): i for i, card in enumerate(self._cards)
+            }
+        return self._cards
+
+    def snapshot(self) -> tuple[int, ...]:
+        """
+        Return the full state of the game as a flat tuple of integers.
+
+        The tuple holds the active enemy, the player and each enemy (see
+        Ship.write_state), the hand's slots as card ids (-1 for an empty
+        slot, so actions on a restored model name the same cards), then a
+        flag for whether there is a deck followed by its state (see
+        CardDeck.write_state).
+        A snapshot can only be restored into the model it was taken from.
+        """
+        self._get_cards()
+        state = [self._active_enemy]
+        self._player.write_state(state)
+        for enemy in self._enemies:
+            enemy.write_state(state)
+        slots = self._hand.get_slots()
+        state.append(len(slots))
+        state += [
+            -1 if card is None else self._card_ids[id(card)] for card in slots
+        ]
+        if self._deck is None:
+            state.append(0)
+        else:
+            state.append(1)
+            self._deck.write_state(state, self._card_ids)
+        return tuple(state)
+
+    def restore(self, snapshot: tuple[int, ...]) -> None:
+        """
+        Return the game to the state it was in when snapshot was taken.
+
+        Parameters:
+            snapshot (tuple[int, ...]): A snapshot taken from this model.
+        """
+        cards = self._get_cards()
+        self._active_enemy = snapshot[0]
+        index = self._player.read_state(snapshot, 1)
+        for enemy in self._enemies:
+            index = enemy.read_state(snapshot, index)
+
+        start = index + 1
+        end = start + snapshot[index]
+        self._hand.set_slots(
+            [
+                None if card_id < 0 else cards[card_id]
+                for card_id in snapshot[start:end]
+            ]
+        )
+        if not snapshot[end]:
+            self._deck = None
+            return
+        if self._deck is None:
+            self._deck = CardDeck([])
+        self._deck.read_state(snapshot, end + 1, cards)
+
+
+def parse_model(model: str, max_hand: int = MAX_HAND) -> BreachModel:
+    """
+    Build a model from its string form, as written to a save file.
+
+    Parameters:
+        model (str): The model string, e.g. str(model).
+        max_hand (int): The number of cards the model's hand is refilled to.
+
+    Returns:
+        BreachModel: The model described, before its first encounter.
+
+    Raises:
+        ValueError: If the model string is malformatted.
+    """
+    VALID_HARDPOINTS = {  # Maps symbols to constructors
+        HARD_POINT_SYMBOL: HardPoint,
+        LL_SYMBOL: LightLaser,
+        HL_SYMBOL: lambda: HeavyLaser(True),  # Yes, I am being cheeky
+        RECHARGING_SYMBOL: lambda: HeavyLaser(False),
+        SG_SYMBOL: ShieldGenerator,
+    }
+
+    # Check corrrect format
+    separated = model.split(PLAYER_SEP)
+    if not len(separated) == 2:
+        raise ValueError(PLAYER_COUNT_CORRUPT)
+    player, enemies = separated
+
+    # Check player is valid format
+    player_params = player.split(SHIP_SEP)
+    player_armour, player_hardpoints, player_energy = (
+        player_params[0],
+        player_params[1:-1],
+        player_params[-1],
+    )
+    if not (player_armour.isdigit() and int(player_armour) >= 0):
+        raise ValueError(CORRUPT_ARMOUR)
+    if not (player_energy.isdigit() and int(player_energy) >= 0):
+        raise ValueError(CORRUPT_ENERGY)
+    if len(player_hardpoints) <= 0:
+        raise ValueError(CORRUPT_HARDPOINT_COUNT)
+    for hardpoint in player_hardpoints:
+        if hardpoint not in VALID_HARDPOINTS:
+            raise ValueError(CORRPUT_HARDPOINT)
+
+    # Generate player
+    validated_player = Player(
+        int(player_armour),
+        [VALID_HARDPOINTS[hp]() for hp in player_hardpoints],
+        int(player_energy),
+    )
+
+    # Check enemies are in valid format
+    if not enemies:
+        raise ValueError(CORRUPT_ENEMY_COUNT)
+    enemies_to_validate = enemies.split(ENEMY_SEP)
+    validated_enemies = []
+    for enemy in enemies_to_validate:
+        enemy_params = enemy.split(SHIP_SEP)
+        enemy_armour, enemy_hardpoints = (
+            enemy_params[0],
+            enemy_params[1:],
+        )
+        if not (enemy_armour.isdigit() and int(enemy_armour) >= 0):
+            raise ValueError(CORRUPT_ARMOUR)
+        for hardpoint in enemy_hardpoints:
+            if hardpoint not in VALID_HARDPOINTS:
+                raise ValueError(CORRPUT_HARDPOINT)
+
+        # may as well construct enemy while we are here
+        validated_enemies.append(
+            Enemy(
+                int(enemy_armour),
+                [VALID_HARDPOINTS[hp]() for hp in enemy_hardpoints],
+            )
+        )
+
+    # If we reached here with no errors, everything is bing chilling
+    return BreachModel(validated_player, validated_enemies, max_hand)
+
+
+def load_model(file: str, max_hand: int = MAX_HAND) -> BreachModel:
+    """
+    Load a model from the specified save file.
+
+    Parameters:
+        file (str): The path to the save file.
+        max_hand (int): The number of cards the model's hand is refilled to.
+
+    Returns:
+        BreachModel: The model saved in the file.
+    """
+    with open(file, "r") as f:
+        model = f.read().split("\n")[0]  # Ignore after first line
+
+    return parse_model(model, max_hand)
 
 
 class BreachWay:
@@ -982,75 +1577,7 @@ class BreachWay:
         Parameters:
             file (str): The path to the save file.
         """
-        VALID_HARDPOINTS = {  # Maps symbols to constructors
-            HARD_POINT_SYMBOL: HardPoint,
-            LL_SYMBOL: LightLaser,
-            HL_SYMBOL: lambda: HeavyLaser(True),  # Yes, I am being cheeky
-            RECHARGING_SYMBOL: lambda: HeavyLaser(False),
-            SG_SYMBOL: ShieldGenerator,
-        }
-
-        # Get model string
-        with open(file, "r") as f:
-            model = f.read().split("\n")[0]  # Ignore after first line
-
-        # Check corrrect format
-        separated = model.split(PLAYER_SEP)
-        if not len(separated) == 2:
-            raise ValueError(PLAYER_COUNT_CORRUPT)
-        player, enemies = separated
-
-        # Check player is valid format
-        player_params = player.split(SHIP_SEP)
-        player_armour, player_hardpoints, player_energy = (
-            player_params[0],
-            player_params[1:-1],
-            player_params[-1],
-        )
-        if not (player_armour.isdigit() and int(player_armour) >= 0):
-            raise ValueError(CORRUPT_ARMOUR)
-        if not (player_energy.isdigit() and int(player_energy) >= 0):
-            raise ValueError(CORRUPT_ENERGY)
-        if len(player_hardpoints) <= 0:
-            raise ValueError(CORRUPT_HARDPOINT_COUNT)
-        for hardpoint in player_hardpoints:
-            if hardpoint not in VALID_HARDPOINTS:
-                raise ValueError(CORRPUT_HARDPOINT)
-
-        # Generate player
-        validated_player = Player(
-            int(player_armour),
-            [VALID_HARDPOINTS[hp]() for hp in player_hardpoints],
-            int(player_energy),
-        )
-
-        # Check enemies are in valid format
-        if not enemies:
-            raise ValueError(CORRUPT_ENEMY_COUNT)
-        enemies_to_validate = enemies.split(ENEMY_SEP)
-        validated_enemies = []
-        for enemy in enemies_to_validate:
-            enemy_params = enemy.split(SHIP_SEP)
-            enemy_armour, enemy_hardpoints = (
-                enemy_params[0],
-                enemy_params[1:],
-            )
-            if not (enemy_armour.isdigit() and int(enemy_armour) >= 0):
-                raise ValueError(CORRUPT_ARMOUR)
-            for hardpoint in enemy_hardpoints:
-                if hardpoint not in VALID_HARDPOINTS:
-                    raise ValueError(CORRPUT_HARDPOINT)
-
-            # may as well construct enemy while we are here
-            validated_enemies.append(
-                Enemy(
-                    int(enemy_armour),
-                    [VALID_HARDPOINTS[hp]() for hp in enemy_hardpoints],
-                )
-            )
-
-        # If we reached here with no errors, everything is bing chilling
-        self._model = BreachModel(validated_player, validated_enemies)
+        self._model = load_model(file)
 
     def play(self) -> None:
         """
@@ -0,0 +1,253 @@
+"""
+Benchmarks of the BreachWay model.
+
+Plays each level part way with a seeded random policy, then times taking
+and restoring `BreachModel.snapshot`s against the alternatives: a
+`copy.deepcopy` of the model, and a round trip through the save format
+(which loses the deck, hand and cooldowns).
+
+Then times enemy targeting on a player ship with thousands of hardpoints
+under fire from an enemy with many weapons, comparing the player's target
+index (`Player.get_target`) with scanning every hardpoint.
+
+Finally times applying each kind of card's effect, compiled
+(`a2.apply_effect`) and as the effect dictionary it is compiled from,
+and playing a card from hands of growing size, as a `Hand` and as a list
+rebuilt without the card.
+
+Usage:
+    python3 bench.py [--number 20000] [--hardpoints 5000] [--weapons 500]
+                     [--turns 20]
+"""
+import argparse
+import copy
+import glob
+import random
+from timeit import timeit
+
+from a2 import (
+    BigBlast,
+    BreachModel,
+    Card,
+    Enemy,
+    Hand,
+    HardPoint,
+    HeavyLaser,
+    LeechEnergy,
+    LightLaser,
+    Player,
+    RaiseShield,
+    Ship,
+    ShieldGenerator,
+    SmallBlast,
+    apply_effect,
+    parse_model,
+)
+from engine import BreachEngine
+from support import DAMAGE, HEAT, SHIELD
+
+SEED = 7030
+LEVELS = "levels/level*.txt"
+WARMUP_ACTIONS = 12
+BIG_ARMOUR = 10**9  # keeps the ships in the targeting benchmark alive
+HAND_SIZES = (5, 50, 500)
+
+
+def _midgame(level: str, rng: random.Random) -> BreachEngine:
+    """
+    Returns a game of the level after a few random actions.
+    """
+    engine = BreachEngine.from_file(level)
+    for _ in range(WARMUP_ACTIONS):
+        if engine.is_terminal():
+            break
+        engine.apply(rng.choice(engine.legal_actions()))
+    return engine
+
+
+def _rate(func, number: int) -> float:
+    """
+    Returns how many times per second func runs.
+    """
+    return number / timeit(func, number=number)
+
+
+def _scan_target(player: Player) -> HardPoint:
+    """
+    Returns the hardpoint enemies target by scanning every hardpoint twice.
+    """
+    hardpoints = player.get_hardpoints()
+    min_health = min(
+        hardpoint.get_armour()
+        for hardpoint in hardpoints
+        if hardpoint.is_functional()
+    )
+    for hardpoint in hardpoints:
+        if hardpoint.get_armour() == min_health:
+            return hardpoint
+    return hardpoints[-1]
+
+
+def _apply_dict_effect(
+    effect: dict[str, int], user: Ship, opponent: Ship, target: HardPoint
+) -> None:
+    """
+    Applies an effect dictionary the way `a2.apply_effect` applies a
+    compiled effect.
+    """
+    user.apply_shield(effect.get(SHIELD, 0))
+    opponent.apply_heat(effect.get(HEAT, 0))
+    if DAMAGE in effect:
+        opponent.apply_damage(effect[DAMAGE], target)
+
+
+def _remove_from_list(hand: list[Card], card: Card) -> list[Card]:
+    """
+    Returns hand without card, rebuilt as play_card used to.
+    """
+    new_hand = []
+    removal_accomplished = False
+    for existing_card in hand:
+        if existing_card == card and not removal_accomplished:
+            removal_accomplished = True
+        else:
+            new_hand.append(existing_card)
+    return new_hand
+
+
+def _fleet_model(num_hardpoints: int, num_weapons: int) -> BreachModel:
+    """
+    Returns a model, mid encounter, of a large player ship against an enemy
+    with many LightLasers.
+    """
+    kinds = [LightLaser, ShieldGenerator, lambda: HeavyLaser(True)]
+    hardpoints = [kinds[i % len(kinds)]() for i in range(num_hardpoints)]
+    player = Player(BIG_ARMOUR, hardpoints, 0)
+    enemy = Enemy(BIG_ARMOUR, [LightLaser() for _ in range(num_weapons)])
+    model = BreachModel(player, [enemy])
+    model.new_encounter()
+    return model
+
+
+def benchmark_branching(number: int) -> None:
+    """
+    Prints snapshot and restore rates for each level.
+    """
+    rng = random.Random(SEED)
+    print(f"{'level':<20}{'method':<14}{'ops/sec':>12}{'size':>8}")
+    for level in sorted(glob.glob(LEVELS)):
+        model = _midgame(level, rng).get_model()
+        snapshot = model.snapshot()
+        saved = str(model)
+        rows = [
+            ("snapshot", model.snapshot, len(snapshot)),
+            ("restore", lambda: model.restore(snapshot), len(snapshot)),
+            ("deepcopy", lambda: copy.deepcopy(model), None),
+            ("save format", lambda: parse_model(str(model)), len(saved)),
+        ]
+        for method, func, size in rows:
+            rate = _rate(func, number)
+            size_text = f"{size:>8}" if size is not None else f"{'-':>8}"
+            print(f"{level:<20}{method:<14}{rate:>12.0f}{size_text}")
+
+
+def benchmark_targeting(
+    num_hardpoints: int, num_weapons: int, turns: int
+) -> None:
+    """
+    Prints how many enemy shots per second can be aimed and resolved with
+    each way of choosing the target, and the rate of whole enemy turns.
+    """
+    print(f"{num_hardpoints} hardpoints against {num_weapons} weapons")
+    print(f"{'method':<14}{'shots/sec':>12}")
+    for method, choose in [
+        ("scan", _scan_target),
+        ("index", Player.get_target),
+    ]:
+        player = _fleet_model(num_hardpoints, num_weapons).get_player()
+
+        def enemy_turns():
+            for _ in range(num_weapons):
+                player.apply_damage(1, choose(player))
+            player.new_turn()
+
+        rate = _rate(enemy_turns, turns) * num_weapons
+        print(f"{method:<14}{rate:>12.0f}")
+
+    model = _fleet_model(num_hardpoints, num_weapons)
+    rate = _rate(model.end_turn, turns) * num_weapons
+    print(f"{'end_turn':<14}{rate:>12.0f}")
+
+
+def benchmark_effects(number: int) -> None:
+    """
+    Prints how many times per second each kind of card's effect can be
+    applied, from its dictionary and compiled.
+    """
+    print(f"{'card':<14}{'dict/sec':>12}{'compiled/sec':>14}")
+    for card in [SmallBlast(), BigBlast(), RaiseShield(), LeechEnergy()]:
+        target = LightLaser()
+        user = Player(BIG_ARMOUR, [LightLaser()], 0)
+        opponent = Enemy(BIG_ARMOUR, [target])
+        effect = card.get_effect()
+        compiled = card.get_compiled_effect()
+        dict_rate = _rate(
+            lambda: _apply_dict_effect(effect, user, opponent, target), number
+        )
+        compiled_rate = _rate(
+            lambda: apply_effect(compiled, user, opponent, target), number
+        )
+        print(f"{card.get_name():<14}{dict_rate:>12.0f}{compiled_rate:>14.0f}")
+
+
+def benchmark_hand(number: int) -> None:
+    """
+    Prints how many times per second a card can be played from the middle
+    of a hand and drawn back onto its end, by hand size: rebuilding a list
+    as play_card used to, and with a `Hand`.
+    """
+    print(f"{'hand size':<14}{'list/sec':>12}{'Hand/sec':>14}")
+    for size in HAND_SIZES:
+        cards: list[Card] = [SmallBlast() for _ in range(size)]
+        card = cards[size // 2]
+        hand = Hand(size)
+        hand.add_cards(cards)
+        hand_list = list(cards)
+
+        def play_list():
+            nonlocal hand_list
+            hand_list = _remove_from_list(hand_list, card)
+            hand_list += [card]
+
+        def play_hand():
+            hand.remove_card(card)
+            hand.add_cards([card])
+
+        list_rate = _rate(play_list, number)
+        hand_rate = _rate(play_hand, number)
+        print(f"{size:<14}{list_rate:>12.0f}{hand_rate:>14.0f}")
+
+
+def main() -> None:
+    """
+    Runs every benchmark with the sizes given on the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--hardpoints", type=int, default=5000)
+    parser.add_argument("--weapons", type=int, default=500)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+    random.seed(SEED)
+
+    benchmark_branching(args.number)
+    print()
+    benchmark_targeting(args.hardpoints, args.weapons, args.turns)
+    print()
+    benchmark_effects(args.number * 10)
+    print()
+    benchmark_hand(args.number)
+
+
+if __name__ == "__main__":
+    main()
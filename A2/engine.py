@@ -0,0 +1,156 @@
+"""
+Headless BreachWay engine.
+
+Plays the same game as `a2.BreachWay.play` (encounters, card plays, enemy
+turns) directly on a `BreachModel`, without input, saving or rendering, so
+AI players can be run against the levels in `levels/` at full speed.
+
+An action is a (hand slot, target hardpoint index) pair, where hand slots
+are those of `BreachModel.get_hand_slots`. Cards that do not deal damage
+have no target (NO_TARGET), and END_TURN ends the turn.
+"""
+from a2 import BreachModel, HardPoint, load_model
+from support import MAX_HAND
+
+Action = tuple[int, int]
+
+NO_TARGET = -1
+END_TURN: Action = (-1, NO_TARGET)
+
+
+class GameOverError(Exception):
+    """
+    Raised when an action is applied after the game has finished.
+    """
+
+    pass
+
+
+class BreachEngine:
+    """
+    A game of BreachWay advanced one action at a time.
+    """
+
+    def __init__(self, model: BreachModel) -> None:
+        """
+        Parameters:
+            model (BreachModel): A model before its first encounter, e.g.
+                                 from `a2.load_model`.
+        """
+        self._model = model
+        self._turns = 0
+        self._start_encounter()
+
+    @classmethod
+    def from_file(cls, file: str, max_hand: int = MAX_HAND) -> "BreachEngine":
+        """
+        Returns an engine for the game in a save file, such as a level,
+        refilling the hand to max_hand cards.
+        """
+        return cls(load_model(file, max_hand))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._model!r})"
+
+    def _start_encounter(self) -> None:
+        """
+        Starts the next encounter once the current one is over, unless the
+        game is over.
+        """
+        if not (self._model.encounter_ongoing() or self.is_terminal()):
+            self._model.new_encounter()
+
+    def get_model(self) -> BreachModel:
+        """
+        Returns the model being played.
+        """
+        return self._model
+
+    def get_turns(self) -> int:
+        """
+        Returns the number of turns ended so far.
+        """
+        return self._turns
+
+    def snapshot(self) -> tuple[int, ...]:
+        """
+        Returns the state of the game, as `BreachModel.snapshot` followed by
+        the number of turns ended.
+        """
+        return (*self._model.snapshot(), self._turns)
+
+    def restore(self, snapshot: tuple[int, ...]) -> None:
+        """
+        Returns the game to the state it was in when snapshot was taken.
+        """
+        self._model.restore(snapshot[:-1])
+        self._turns = snapshot[-1]
+
+    def is_terminal(self) -> bool:
+        """
+        Returns whether the player has won or lost.
+        """
+        return self._model.has_won() or self._model.has_lost()
+
+    def legal_actions(self) -> list[Action]:
+        """
+        Returns every action that changes the game, with END_TURN first.
+
+        Cards the player cannot afford are left out, since playing them has
+        no effect, as are repeats of a kind of card already in the list.
+
+        Returns:
+            (list[Action]): The legal actions, or [] if the game is over.
+        """
+        if self.is_terminal():
+            return []
+        enemy = self._model.get_active_enemy()
+        assert enemy is not None
+        targets = range(len(enemy.get_hardpoints()))
+        energy = self._model.get_player().get_energy()
+
+        actions = [END_TURN]
+        seen = set()
+        for index, card in enumerate(self._model.get_hand_slots()):
+            if card is None:
+                continue
+            kind = card.get_name()
+            if kind in seen or card.get_cost() > energy:
+                continue
+            seen.add(kind)
+            if card.get_compiled_effect()[2] is not None:
+                actions += [(index, target) for target in targets]
+            else:
+                actions.append((index, NO_TARGET))
+        return actions
+
+    def apply(self, action: Action) -> bool:
+        """
+        Applies an action, then starts the next encounter if this one is
+        over.
+
+        Parameters:
+            action (Action): END_TURN, or a card to play and its target.
+
+        Returns:
+            (bool): False if a card could not be played for lack of energy.
+        """
+        if self.is_terminal():
+            raise GameOverError("The game is already over")
+        if action == END_TURN:
+            self._model.end_turn()
+            self._turns += 1
+            self._start_encounter()
+            return True
+
+        index, target = action
+        card = self._model.get_hand_slots()[index]
+        assert card is not None
+        target_hardpoint = HardPoint()  # dummy if not required
+        if target != NO_TARGET:
+            enemy = self._model.get_active_enemy()
+            assert enemy is not None
+            target_hardpoint = enemy.get_hardpoints()[target]
+        success = self._model.play_card(card, target_hardpoint)
+        self._start_encounter()
+        return success
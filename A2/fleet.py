@@ -0,0 +1,376 @@
+"""
+Columnar fleet engine for very large BreachWay encounters.
+
+`Fleet` holds the same state as a player `Ship` and its `Enemy`s, but as
+columns instead of objects: armour, heat and shield are arrays indexed by
+ship, and every hardpoint of every ship is one byte of a single bytearray,
+packing its kind, its position in its cycle of enemy actions and its
+health. An enemy turn (`BreachModel.end_turn` without the deck) is then
+resolved in whole-volley steps that run in C: `bytes.translate` advances
+every cycle and repairs hardpoints, `bytes.count` totals the effects, and
+`accumulate`/`bisect` find where the player's shield runs out and which
+hardpoints the volley destroys, following `Ship._shield_absorb` and the
+lowest-armour targeting rule.
+
+Running this module plays a stress level with both engines, checking that
+they agree and timing each turn.
+
+Usage:
+    python3 fleet.py [--hardpoints 100000] [--turns 5] [--seed 7030]
+"""
+import argparse
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from time import perf_counter
+
+from a2 import (
+    BreachModel,
+    Enemy,
+    HardPoint,
+    HeavyLaser,
+    LightLaser,
+    Player,
+    ShieldGenerator,
+    Ship,
+)
+from support import DAMAGE, HEAT, SHIELD
+
+PLAYER = 0  # ship index of the player; enemy i is ship i + 1
+
+# A hardpoint byte is kind << KIND_SHIFT | cycle << CYCLE_SHIFT | health
+KIND_SHIFT = 4
+CYCLE_SHIFT = 2
+CYCLE_MASK = 0b11
+HEALTH_MASK = 0b11
+CODES = 1 << 6
+
+# One hardpoint of each kind, in kind order, to read the tables from
+_TEMPLATES = (HardPoint(), LightLaser(), ShieldGenerator(), HeavyLaser(True))
+_KINDS = {type(template): kind for kind, template in enumerate(_TEMPLATES)}
+
+
+def _pack(kind: int, cycle: int, health: int) -> int:
+    """
+    Returns the byte for a hardpoint.
+    """
+    return kind << KIND_SHIFT | cycle << CYCLE_SHIFT | health
+
+
+def _build_tables() -> tuple[list[tuple[int, int, int]], list[bytes]]:
+    """
+    Reads the action cycle and armour of each kind of hardpoint from
+    `_TEMPLATES`.
+
+    Returns:
+        (tuple[list[tuple[int, int, int]], list[bytes]]): The (shield, heat,
+            damage) of the action played by a hardpoint with each byte,
+            and the translation tables that advance its cycle, repair it,
+            and give its health, shield/heat/damage load and hit damage.
+    """
+    effects = [(0, 0, 0)] * CODES
+    advance = bytearray(range(256))
+    repair = bytearray(range(256))
+    health = bytearray(256)
+    load = bytearray(256)
+    hit = bytearray(256)
+    for kind, template in enumerate(_TEMPLATES):
+        template.repair()
+        max_health = template.get_armour()
+        for cycle in range(len(template.get_cards())):
+            template.set_state(max_health, cycle)
+            effect = template.enemy_action()
+            next_cycle = template.get_cycle()
+            damage = effect.get(DAMAGE, 0)
+            repair[_pack(kind, cycle, 0)] = _pack(kind, cycle, max_health)
+            for points in range(1, max_health + 1):
+                code = _pack(kind, cycle, points)
+                effects[code] = (
+                    effect.get(SHIELD, 0),
+                    effect.get(HEAT, 0),
+                    damage,
+                )
+                advance[code] = _pack(kind, next_cycle, points)
+                health[code] = points
+                load[code] = effect.get(HEAT, 0) + damage
+                hit[code] = damage - damage // 2
+    return effects, [
+        bytes(table) for table in (advance, repair, health, load, hit)
+    ]
+
+
+EFFECTS, (ADVANCE, REPAIR, HEALTH, LOAD, HIT) = _build_tables()
+ACTIVE_CODES = [code for code in range(CODES) if any(EFFECTS[code])]
+DESTROYED_CODES = [code for code in range(CODES) if REPAIR[code] != code]
+
+
+class Fleet:
+    """
+    The player's ship and the enemies of a BreachWay game, stored as
+    columns for resolving enemy turns in bulk.
+    """
+
+    def __init__(self, player: Player, enemies: list[Enemy]) -> None:
+        """
+        Parameters:
+            player (Player): The player's ship, copied into the fleet.
+            enemies (list[Enemy]): The enemies, copied into the fleet.
+        """
+        ships: list[Ship] = [player, *enemies]
+        self._energy = player.get_energy()
+        self._armour = array("q", (ship.get_armour() for ship in ships))
+        self._heat = array("q", (ship.get_heat() for ship in ships))
+        self._shield = array("q", (ship.get_shield() for ship in ships))
+        self._starts = array("q", [0])
+        self._hardpoints = bytearray()
+        for ship in ships:
+            self._hardpoints += bytes(
+                _pack(_KINDS[type(hp)], hp.get_cycle(), hp.get_armour())
+                for hp in ship.get_hardpoints()
+            )
+            self._starts.append(len(self._hardpoints))
+
+    @classmethod
+    def from_model(cls, model: BreachModel) -> "Fleet":
+        """
+        Returns a fleet with the ships of a model.
+        """
+        return cls(model.get_player(), model.get_enemies())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({len(self._armour)} ships, "
+            f"{len(self._hardpoints)} hardpoints)"
+        )
+
+    def _span(self, ship: int) -> slice:
+        return slice(self._starts[ship], self._starts[ship + 1])
+
+    def get_energy(self) -> int:
+        """
+        Returns the player's energy.
+        """
+        return self._energy
+
+    def get_armour(self, ship: int) -> int:
+        """
+        Returns the armour of a ship.
+        """
+        return self._armour[ship]
+
+    def get_heat(self, ship: int) -> int:
+        """
+        Returns the heat of a ship.
+        """
+        return self._heat[ship]
+
+    def get_shield(self, ship: int) -> int:
+        """
+        Returns the shield of a ship.
+        """
+        return self._shield[ship]
+
+    def get_hardpoint_armour(self, ship: int) -> bytes:
+        """
+        Returns the armour of each hardpoint of a ship.
+        """
+        return self._hardpoints[self._span(ship)].translate(HEALTH)
+
+    def write_state(self, ship: int, state: list[int]) -> None:
+        """
+        Appends a ship's state to state in the layout of `Ship.write_state`,
+        with the energy first for the player as in `Player.write_state`.
+        """
+        if ship == PLAYER:
+            state.append(self._energy)
+        state += (self._armour[ship], self._heat[ship], self._shield[ship])
+        for code in self._hardpoints[self._span(ship)]:
+            state += (code & HEALTH_MASK, code >> CYCLE_SHIFT & CYCLE_MASK)
+
+    def apply_shield(self, ship: int, shield_points: int) -> None:
+        """
+        Increases a ship's shield, as `Ship.apply_shield`.
+        """
+        self._shield[ship] += shield_points
+
+    def _strike(self, hits: bytes) -> None:
+        """
+        Damages the player's hardpoints with a sequence of hits, each aimed
+        at the functional hardpoint with the lowest armour (then earliest).
+
+        A hardpoint keeps the lowest armour while it is hit, so the volley
+        destroys hardpoints in the order they are targeted at the start,
+        each taking hits until their total reaches its armour, and any
+        excess of the final hit is lost.
+        """
+        totals = list(accumulate(hits))
+        if not totals or not totals[-1]:
+            return
+        last = totals[-1]
+        start = self._starts[PLAYER]
+        hardpoints = self._hardpoints
+        health = hardpoints[self._span(PLAYER)].translate(HEALTH)
+        used = 0  # total of the hits already spent
+        hit = 0
+        for points in range(1, HEALTH_MASK + 1):
+            position = health.find(points)
+            while position >= 0:
+                need = used + points
+                if need > last:
+                    hardpoints[start + position] -= last - used
+                    return
+                hit = bisect_left(totals, need, hit)
+                hardpoints[start + position] -= points
+                used = totals[hit]
+                if used == last:
+                    return
+                hit += 1
+                position = health.find(points, position + 1)
+
+    def _fire(self, enemy: int) -> None:
+        """
+        Plays the action of every hardpoint of an enemy ship against the
+        player, in order, as `BreachModel.end_turn`.
+        """
+        span = self._span(enemy)
+        codes = bytes(self._hardpoints[span])
+        self._hardpoints[span] = codes.translate(ADVANCE)
+        for code in ACTIVE_CODES:
+            self._shield[enemy] += EFFECTS[code][0] * codes.count(code)
+
+        # The player's shield absorbs heat then damage of each action until
+        # it runs out part way through the action at index first
+        shield = self._shield[PLAYER]
+        first = 0
+        heat = hull = 0
+        hits = b""
+        if shield:
+            loads = list(accumulate(codes.translate(LOAD)))
+            first = bisect_right(loads, shield)
+            if first == len(codes):
+                self._shield[PLAYER] = shield - (loads[-1] if loads else 0)
+                return
+            left = shield - (loads[first - 1] if first else 0)
+            _, action_heat, damage = EFFECTS[codes[first]]
+            heat = max(action_heat - left, 0)
+            damage = max(damage - max(left - action_heat, 0), 0)
+            hull = damage // 2
+            hits = bytes([damage - hull])
+            first += 1
+            self._shield[PLAYER] = 0
+
+        for code in ACTIVE_CODES:
+            count = codes.count(code, first)
+            _, action_heat, damage = EFFECTS[code]
+            heat += action_heat * count
+            hull += damage // 2 * count
+        self._heat[PLAYER] += heat
+        self._strike(hits + codes[first:].translate(HIT))
+        self._armour[PLAYER] = max(self._armour[PLAYER] - hull, 0)
+
+    def new_turn(self, ship: int) -> None:
+        """
+        Updates a ship at the start of a new turn, as `Ship.new_turn` (and
+        `Player.new_turn` for the player).
+        """
+        span = self._span(ship)
+        hardpoints = self._hardpoints[span]
+        if ship == PLAYER:
+            destroyed = sum(hardpoints.count(c) for c in DESTROYED_CODES)
+            self._energy += len(hardpoints) - destroyed
+        self._hardpoints[span] = hardpoints.translate(REPAIR)
+
+        if self._heat[ship] > 0:
+            self._armour[ship] = max(self._armour[ship] - self._heat[ship], 0)
+            self._heat[ship] -= 1
+        self._shield[ship] //= 2
+
+    def enemy_turn(self, enemy: int) -> None:
+        """
+        Resolves an enemy's turn against the player, then starts a new turn
+        for both, as `BreachModel.end_turn` does for the active enemy.
+
+        Parameters:
+            enemy (int): The ship index of the enemy (1 for the first).
+        """
+        if not PLAYER < enemy < len(self._armour):
+            raise ValueError(f"Not an enemy ship: {enemy}")
+        self._fire(enemy)
+        self.new_turn(PLAYER)
+        self.new_turn(enemy)
+
+
+def stress_model(num_hardpoints: int, rng: random.Random) -> BreachModel:
+    """
+    Returns a model, in its first encounter, of a player and an enemy that
+    each have num_hardpoints hardpoints of random kinds and armour enough to
+    survive.
+    """
+    kinds = [LightLaser, ShieldGenerator, lambda: HeavyLaser(True)]
+
+    def hardpoints() -> list[HardPoint]:
+        return [rng.choice(kinds)() for _ in range(num_hardpoints)]
+
+    armour = 100 * num_hardpoints
+    model = BreachModel(
+        Player(armour, hardpoints(), 0), [Enemy(armour, hardpoints())]
+    )
+    model.new_encounter()
+    return model
+
+
+def _states(model: BreachModel, fleet: Fleet) -> tuple[list, list]:
+    """
+    Returns the state of the player and active enemy in each engine.
+    """
+    expected: list[int] = []
+    model.get_player().write_state(expected)
+    enemy = model.get_active_enemy()
+    assert enemy is not None
+    enemy.write_state(expected)
+    actual: list[int] = []
+    fleet.write_state(PLAYER, actual)
+    fleet.write_state(1, actual)
+    return expected, actual
+
+
+def main() -> None:
+    """
+    Plays enemy turns of a stress level with both engines, printing the
+    time each takes and checking their states agree.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--hardpoints", type=int, default=100000)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7030)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    rng = random.Random(args.seed)
+
+    model = stress_model(args.hardpoints, rng)
+    fleet = Fleet.from_model(model)
+    print(f"{'turn':<6}{'model ms':>10}{'fleet ms':>10}  states")
+    for turn in range(1, args.turns + 1):
+        # Some shield for the enemy to break through
+        shield = rng.randrange(args.hardpoints)
+        model.get_player().apply_shield(shield)
+        fleet.apply_shield(PLAYER, shield)
+
+        start = perf_counter()
+        model.end_turn()
+        model_time = perf_counter() - start
+        start = perf_counter()
+        fleet.enemy_turn(1)
+        fleet_time = perf_counter() - start
+
+        expected, actual = _states(model, fleet)
+        agree = "agree" if expected == actual else "DIFFER"
+        print(
+            f"{turn:<6}{model_time * 1000:>10.1f}"
+            f"{fleet_time * 1000:>10.1f}  {agree}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Monte Carlo tree search player for BreachWay.
+
+Each move searches from a snapshot of the current game: every iteration
+restores the snapshot, follows the tree by UCB1, expands one new action,
+plays a short rollout with the greedy policy (with some random moves) and
+scores the result. The tree is open loop, keyed by actions rather than
+states, because a new encounter reshuffles the deck. With several processes,
+each worker runs its own search from the same snapshot and their visit
+counts are summed (root parallelisation).
+
+Usage:
+    python3 mcts.py [levels/level2.txt ...] [--games 20] [--iterations 400]
+                    [--time 0.1] [--processes N]
+"""
+import argparse
+import glob
+import math
+import random
+from multiprocessing import Pool
+from time import perf_counter
+
+from a2 import BreachModel, parse_model
+from engine import Action, BreachEngine
+from simulate import DEFAULT_LEVELS, DEFAULT_SEED, MAX_TURNS, greedy_policy
+
+DEFAULT_ITERATIONS = 400
+EXPLORATION = 1.4
+ROLLOUT_DEPTH = 20  # actions played out before scoring the position
+ROLLOUT_RANDOMNESS = 0.2  # chance of a random action instead of greedy
+
+SearchStats = dict[Action, tuple[int, float]]  # action -> (visits, value)
+
+
+class _Node:
+    """
+    Statistics of one action sequence from the root.
+    """
+
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[Action, _Node] = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+def _score(model: BreachModel, enemy_armour: int, player_armour: int) -> float:
+    """
+    Scores a position between 0 (lost) and 1 (won), by the share of enemy
+    armour destroyed and player armour kept since the search started.
+    """
+    if model.has_won():
+        return 1.0
+    if model.has_lost():
+        return 0.0
+    enemies_left = sum(enemy.get_armour() for enemy in model.get_enemies())
+    player_left = model.get_player().get_armour()
+    return 0.5 * (1 - enemies_left / enemy_armour) + 0.5 * min(
+        player_left / player_armour, 1.0
+    )
+
+
+def search(
+    engine: BreachEngine,
+    iterations: int | None,
+    time_limit: float | None,
+    rng: random.Random,
+) -> tuple[SearchStats, int]:
+    """
+    Searches from the current state of engine, leaving it unchanged.
+
+    Parameters:
+        engine (BreachEngine): The game to search from. Not over.
+        iterations (int | None): The most iterations to run.
+        time_limit (float | None): The most seconds to search for.
+        rng (random.Random): Chooses expansions and random rollout moves.
+
+    Returns:
+        (tuple[SearchStats, int]): The visits and total value of each action
+                                   from the root, and the iterations run.
+    """
+    root_state = engine.snapshot()
+    model = engine.get_model()
+    enemy_armour = max(1, sum(e.get_armour() for e in model.get_enemies()))
+    player_armour = max(1, model.get_player().get_armour())
+    deadline = None if time_limit is None else perf_counter() + time_limit
+    # new_encounter shuffles with the global generator, so protect the
+    # caller's stream from the search
+    random_state = random.getstate()
+
+    root = _Node()
+    runs = 0
+    while (iterations is None or runs < iterations) and (
+        deadline is None or perf_counter() < deadline
+    ):
+        engine.restore(root_state)
+        node = root
+        path = [root]
+        while not engine.is_terminal():
+            actions = engine.legal_actions()
+            untried = [a for a in actions if a not in node.children]
+            if untried:
+                action = rng.choice(untried)
+                node.children[action] = node = _Node()
+                engine.apply(action)
+                path.append(node)
+                break
+            log_visits = math.log(node.visits)
+            children = node.children
+            action = max(
+                actions,
+                key=lambda a: children[a].value / children[a].visits
+                + EXPLORATION * math.sqrt(log_visits / children[a].visits),
+            )
+            node = children[action]
+            engine.apply(action)
+            path.append(node)
+
+        for _ in range(ROLLOUT_DEPTH):
+            if engine.is_terminal():
+                break
+            if rng.random() < ROLLOUT_RANDOMNESS:
+                engine.apply(rng.choice(engine.legal_actions()))
+            else:
+                engine.apply(greedy_policy(engine, rng))
+        reward = _score(model, enemy_armour, player_armour)
+        for node in path:
+            node.visits += 1
+            node.value += reward
+        runs += 1
+
+    engine.restore(root_state)
+    random.setstate(random_state)
+    stats = {
+        a: (child.visits, child.value) for a, child in root.children.items()
+    }
+    return stats, runs
+
+
+# The per-process engine for the game being searched, and the save string and
+# hand size it was built from. The engine is rebuilt only when a new game
+# starts.
+_worker_engine: BreachEngine | None = None
+_worker_game: tuple[str, int] = ("", 0)
+
+
+def _worker_search(
+    args: tuple[str, int, tuple[int, ...], int | None, float | None, int]
+) -> tuple[SearchStats, int]:
+    global _worker_engine, _worker_game
+    layout, max_hand, state, iterations, time_limit, seed = args
+    if _worker_engine is None or (layout, max_hand) != _worker_game:
+        _worker_engine = BreachEngine(parse_model(layout, max_hand))
+        _worker_game = (layout, max_hand)
+    _worker_engine.restore(state)
+    return search(_worker_engine, iterations, time_limit, random.Random(seed))
+
+
+class MCTSPlayer:
+    """
+    Chooses BreachWay actions by Monte Carlo tree search, with a budget of
+    iterations and/or time per move.
+    """
+
+    def __init__(
+        self,
+        iterations: int | None = DEFAULT_ITERATIONS,
+        time_limit: float | None = None,
+        processes: int = 1,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        """
+        Parameters:
+            iterations (int | None): Iterations per move, split between the
+                                     processes. None for no limit.
+            time_limit (float | None): Seconds per move. None for no limit.
+            processes (int): Processes to search with. 1 searches in this
+                             process.
+            seed (int): Seeds the search.
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("A search needs an iteration or time budget")
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._processes = processes
+        self._rng = random.Random(seed)
+        self._pool = Pool(processes) if processes > 1 else None
+        # The model of the game being played and the save string sent to
+        # the workers for it, which stays the same for the whole game
+        self._model: BreachModel | None = None
+        self._layout = ""
+        self._rollouts = 0
+        self._search_time = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._iterations}, "
+            f"{self._time_limit}, {self._processes})"
+        )
+
+    def __enter__(self) -> "MCTSPlayer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes, if any.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def get_rollouts(self) -> int:
+        """
+        Returns the number of rollouts played so far.
+        """
+        return self._rollouts
+
+    def rollouts_per_second(self) -> float:
+        """
+        Returns the rollouts played per second of searching.
+        """
+        if not self._search_time:
+            return 0.0
+        return self._rollouts / self._search_time
+
+    def choose(self, engine: BreachEngine) -> Action:
+        """
+        Returns the action to play in the current state of a game.
+
+        Parameters:
+            engine (BreachEngine): The game. Not over, and left unchanged.
+        """
+        actions = engine.legal_actions()
+        if len(actions) == 1:
+            return actions[0]
+
+        start = perf_counter()
+        if self._pool is None:
+            stats, runs = search(
+                engine, self._iterations, self._time_limit, self._rng
+            )
+            results = [(stats, runs)]
+        else:
+            iterations = self._iterations
+            if iterations is not None:
+                iterations = -(-iterations // self._processes)
+            if engine.get_model() is not self._model:
+                self._model = engine.get_model()
+                self._layout = str(self._model)
+            state = engine.snapshot()
+            tasks = [
+                (
+                    self._layout,
+                    self._model.get_max_hand(),
+                    state,
+                    iterations,
+                    self._time_limit,
+                    self._rng.getrandbits(32),
+                )
+                for _ in range(self._processes)
+            ]
+            results = self._pool.map(_worker_search, tasks)
+        self._search_time += perf_counter() - start
+
+        totals: dict[Action, list[float]] = {}
+        for stats, runs in results:
+            self._rollouts += runs
+            for action, (visits, value) in stats.items():
+                total = totals.setdefault(action, [0, 0.0])
+                total[0] += visits
+                total[1] += value
+        return max(totals, key=lambda action: tuple(totals[action]))
+
+    def __call__(self, engine: BreachEngine, rng: random.Random) -> Action:
+        """
+        Chooses an action, so a player can be used as a `simulate.Policy`.
+        """
+        return self.choose(engine)
+
+
+def main() -> None:
+    """
+    Plays levels with the MCTS player and reports wins and rollouts/sec.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("levels", nargs="*")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument("--time", type=float, default=None)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    if args.iterations is None and args.time is None:
+        args.iterations = DEFAULT_ITERATIONS
+
+    levels = args.levels or sorted(glob.glob(DEFAULT_LEVELS))
+    with MCTSPlayer(
+        args.iterations, args.time, args.processes, args.seed
+    ) as player:
+        for level in levels:
+            wins = 0
+            for game in range(args.games):
+                random.seed(f"{args.seed}:{level}:{game}")
+                engine = BreachEngine.from_file(level)
+                while (
+                    not engine.is_terminal() and engine.get_turns() < MAX_TURNS
+                ):
+                    engine.apply(player.choose(engine))
+                wins += engine.get_model().has_won()
+            print(f"{level}: won {wins}/{args.games}")
+        print(f"Rollouts: {player.get_rollouts()}")
+        print(f"Rollouts/sec: {player.rollouts_per_second():.0f}")
+
+
+if __name__ == "__main__":
+    main()
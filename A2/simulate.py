@@ -0,0 +1,295 @@
+"""
+Level balance simulator for BreachWay.
+
+Plays each level many times with a player policy on the headless engine,
+across a process pool, and reports the win rate along with the turns taken
+and hull damage taken in each encounter, per enemy. Every game reseeds the
+generator behind `shuffle_cards` (and the policy's own generator) from
+(seed, level, game number), so results do not depend on how games are split
+between processes.
+
+Usage:
+    python3 simulate.py [levels/level1.txt ...] [--games 5000]
+                        [--policy greedy] [--processes N]
+"""
+import argparse
+import glob
+import os
+import random
+from multiprocessing import Pool
+from typing import Callable
+
+from engine import END_TURN, NO_TARGET, Action, BreachEngine
+
+DEFAULT_SEED = 7030
+DEFAULT_LEVELS = "levels/level*.txt"
+CHUNK_SIZE = 500
+MAX_TURNS = 200  # games still going after this many turns are abandoned
+
+Policy = Callable[[BreachEngine, random.Random], Action]
+
+
+def random_policy(engine: BreachEngine, rng: random.Random) -> Action:
+    """
+    Chooses uniformly between every legal action, including ending the turn.
+    """
+    return rng.choice(engine.legal_actions())
+
+
+def greedy_policy(engine: BreachEngine, rng: random.Random) -> Action:
+    """
+    Plays the hardest hitting affordable card at the weakest functional
+    enemy hardpoint, then the best shield card, then ends the turn.
+    """
+    model = engine.get_model()
+    hand = model.get_hand_slots()
+    enemy = model.get_active_enemy()
+    assert enemy is not None
+    hardpoints = enemy.get_hardpoints()
+
+    best_action = END_TURN
+    best_value = (0, 0)
+    for index, target in engine.legal_actions()[1:]:
+        card = hand[index]
+        assert card is not None
+        shield, _, damage = card.get_compiled_effect()
+        if target == NO_TARGET:
+            value = (0, shield)
+        else:
+            hardpoint = hardpoints[target]
+            if not hardpoint.is_functional():
+                continue
+            value = (damage, -hardpoint.get_armour())
+        if best_action == END_TURN or value > best_value:
+            best_action = (index, target)
+            best_value = value
+    return best_action
+
+
+POLICIES: dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+class LevelResult:
+    """
+    Aggregated results of a number of games of one level.
+    """
+
+    def __init__(self, level: str) -> None:
+        """
+        Parameters:
+            level (str): The path of the level played.
+        """
+        self._level = level
+        self._games = 0
+        self._wins = 0
+        self._abandoned = 0
+        # Per enemy: encounters fought, turns and hull damage taken in them
+        self._encounters: list[int] = []
+        self._turns: list[int] = []
+        self._damage: list[int] = []
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self._level}: {self._games} games",
+            f"  Win rate: {self.win_rate():.2%}",
+            f"  Abandoned after {MAX_TURNS} turns: {self._abandoned}",
+        ]
+        for enemy, encounters in enumerate(self._encounters):
+            if not encounters:
+                continue
+            lines.append(
+                f"  Enemy {enemy + 1}: {encounters} encounters, "
+                f"{self._turns[enemy] / encounters:.2f} turns, "
+                f"{self._damage[enemy] / encounters:.2f} damage taken"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._level!r}, "
+            f"games={self._games}, wins={self._wins})"
+        )
+
+    def _grow(self, num_enemies: int) -> None:
+        extra = num_enemies - len(self._encounters)
+        if extra > 0:
+            self._encounters += [0] * extra
+            self._turns += [0] * extra
+            self._damage += [0] * extra
+
+    def add_encounter(self, enemy: int, turns: int, damage: int) -> None:
+        """
+        Adds one encounter with the enemy at the given index.
+        """
+        self._grow(enemy + 1)
+        self._encounters[enemy] += 1
+        self._turns[enemy] += turns
+        self._damage[enemy] += damage
+
+    def add_game(self, engine: BreachEngine) -> None:
+        """
+        Adds a finished (or abandoned) game to the results.
+        """
+        self._games += 1
+        if engine.get_model().has_won():
+            self._wins += 1
+        elif not engine.is_terminal():
+            self._abandoned += 1
+
+    def merge(self, other: "LevelResult") -> None:
+        """
+        Adds the results of another simulation of the same level.
+        """
+        self._games += other._games
+        self._wins += other._wins
+        self._abandoned += other._abandoned
+        self._grow(len(other._encounters))
+        for enemy, encounters in enumerate(other._encounters):
+            self._encounters[enemy] += encounters
+            self._turns[enemy] += other._turns[enemy]
+            self._damage[enemy] += other._damage[enemy]
+
+    def get_level(self) -> str:
+        """
+        Returns the path of the level played.
+        """
+        return self._level
+
+    def get_games(self) -> int:
+        """
+        Returns the number of games played.
+        """
+        return self._games
+
+    def get_wins(self) -> int:
+        """
+        Returns the number of games won.
+        """
+        return self._wins
+
+    def win_rate(self) -> float:
+        """
+        Returns the fraction of games won.
+        """
+        return self._wins / self._games if self._games else 0.0
+
+
+def play_level(
+    level: str, policy: Policy, rng: random.Random, result: LevelResult
+) -> BreachEngine:
+    """
+    Plays one game of a level to the end, recording each encounter.
+
+    Parameters:
+        level (str): The path of the level to play.
+        policy (Policy): Chooses each action.
+        rng (random.Random): The policy's generator.
+        result (LevelResult): Where to record the encounters.
+
+    Returns:
+        (BreachEngine): The finished (or abandoned) game.
+    """
+    engine = BreachEngine.from_file(level)
+    model = engine.get_model()
+    player = model.get_player()
+    enemy_numbers = {
+        id(enemy): i for i, enemy in enumerate(model.get_enemies())
+    }
+
+    enemy = model.get_active_enemy()
+    start_turn = 0
+    start_armour = player.get_armour()
+    while True:
+        over = engine.is_terminal() or engine.get_turns() >= MAX_TURNS
+        if over or model.get_active_enemy() is not enemy:
+            assert enemy is not None
+            result.add_encounter(
+                enemy_numbers[id(enemy)],
+                engine.get_turns() - start_turn,
+                start_armour - player.get_armour(),
+            )
+            if over:
+                return engine
+            enemy = model.get_active_enemy()
+            start_turn = engine.get_turns()
+            start_armour = player.get_armour()
+        engine.apply(policy(engine, rng))
+
+
+def _run_chunk(args: tuple[str, str, int, int, int]) -> LevelResult:
+    level, policy_name, seed, start, stop = args
+    policy = POLICIES[policy_name]
+    result = LevelResult(level)
+    for game in range(start, stop):
+        game_seed = f"{seed}:{os.path.basename(level)}:{game}"
+        random.seed(game_seed)  # drives shuffle_cards
+        rng = random.Random(f"{game_seed}:policy")
+        result.add_game(play_level(level, policy, rng, result))
+    return result
+
+
+def simulate(
+    levels: list[str],
+    num_games: int,
+    policy: str = "greedy",
+    seed: int = DEFAULT_SEED,
+    processes: int | None = None,
+) -> list[LevelResult]:
+    """
+    Plays every level num_games times across a process pool.
+
+    Parameters:
+        levels (list[str]): The paths of the levels to play.
+        num_games (int): The number of games of each level.
+        policy (str): The player policy, a key of POLICIES.
+        seed (int): The seed that every game's generators are derived from.
+        processes (int | None): Worker processes. Defaults to the CPU count.
+                                1 plays every game in this process.
+
+    Returns:
+        (list[LevelResult]): The results for each level, in order.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    chunks = [
+        (level, policy, seed, start, min(start + CHUNK_SIZE, num_games))
+        for level in levels
+        for start in range(0, num_games, CHUNK_SIZE)
+    ]
+    results = {level: LevelResult(level) for level in levels}
+    if processes == 1:
+        chunk_results = map(_run_chunk, chunks)
+        for chunk_result in chunk_results:
+            results[chunk_result.get_level()].merge(chunk_result)
+    else:
+        with Pool(processes) as pool:
+            for chunk_result in pool.imap_unordered(_run_chunk, chunks):
+                results[chunk_result.get_level()].merge(chunk_result)
+    return list(results.values())
+
+
+def main() -> None:
+    """
+    Simulates levels from the command line and prints their results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("levels", nargs="*")
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    levels = args.levels or sorted(glob.glob(DEFAULT_LEVELS))
+    results = simulate(
+        levels, args.games, args.policy, args.seed, args.processes
+    )
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
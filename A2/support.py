@@ -86,37 +86,33 @@ def shuffle_cards(card_list: list["Card"]):
         card_list (list[Card]): list of cards that will be shuffled in place.
     """
 
-    card_types = []
-    to_choose = {}
-
-    # Sort cards into groups so random sampling is consistent
-    while card_list:
-        curr_card = card_list.pop()
-        curr_name = curr_card.get_name()
-        if curr_name not in to_choose:
-            card_types.append(curr_name)
-            to_choose[curr_name] = [curr_card]
-        else:
-            # Check for ailiasing to prevent nasty bugs later on
-            if any(card is curr_card for card in to_choose[curr_name]):
-                raise ValueError(
-                    "You have multiple references to the same card."
-                    + " Please ensure each card is being created "
-                    "as a new instance."
-                )
-
-            else:
-                to_choose[curr_name].append(curr_card)
-
-    card_types.sort()  # ensure consistency regardless of initial card order
-
-    # Replace cards in a random order
-    while to_choose:
+    to_choose: dict[str, list] = {}
+    seen = set()
+
+    # Sort cards into groups so random sampling is consistent. Groups are
+    # filled from the end of the list, as if popping each card in turn.
+    for curr_card in reversed(card_list):
+        # Check for ailiasing to prevent nasty bugs later on
+        if id(curr_card) in seen:
+            raise ValueError(
+                "You have multiple references to the same card."
+                + " Please ensure each card is being created "
+                "as a new instance."
+            )
+        seen.add(id(curr_card))
+        to_choose.setdefault(curr_card.get_name(), []).append(curr_card)
+    card_list.clear()
+
+    # ensure consistency regardless of initial card order
+    card_types = sorted(to_choose)
+
+    # Replace cards in a random order. There are only a handful of kinds of
+    # card, so removing a finished kind from card_types is cheap, and
+    # choice() must see the same list to consume the same random numbers.
+    while card_types:
         key = choice(card_types)
-        new_card = to_choose[key].pop()
+        group = to_choose[key]
+        card_list.append(group.pop())
 
-        if not to_choose[key]:
-            to_choose.pop(key)
+        if not group:
             card_types.remove(key)
-
-        card_list.append(new_card)